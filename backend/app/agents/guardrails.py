@@ -0,0 +1,158 @@
+"""
+Grounding guardrail for agent answers.
+
+Each answer sentence is scored by lexical overlap with the retrieved chunks:
+the share of its content terms that appear in the best-matching chunk. The
+chunks are indexed once per run (term -> chunk ids), so scoring a sentence is
+a single pass over its terms that updates every chunk's overlap at once,
+independent of how many chunks were retrieved.
+
+Numbers must also appear in the best-matching chunk: a sentence that copies
+a chunk but changes "20 days" to "90 days" still overlaps almost entirely.
+
+Sentences are checked as they complete while the answer streams; ones below
+GUARDRAIL_MIN_OVERLAP or with unsupported numbers are retracted and, when a
+chunk matches partially, replaced by that chunk as the correction.
+"""
+import re
+from dataclasses import dataclass
+
+from app.core.config import settings
+
+_TERM = re.compile(r"[a-z0-9]+")
+_NUMBER = re.compile(r"\d+(?:[.,]\d+)*")
+# Sentence ends at . ! ? followed by whitespace, or at a line break.
+_BOUNDARY = re.compile(r"(?<=[.!?])\s+|\s*\n+\s*")
+_LIST_MARKER = re.compile(r"^(?:[-*•]|\d+[.)])\s+")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by can do does for from has have how i if in is it its "
+    "may me my of on or our per so such that the their there these this to up us "
+    "was we what when where which while who will with you your".split()
+)
+# Conversational openers. A sentence starting with one is only exempt when it
+# has no numbers and fewer than MIN_TERMS terms from the sources, so
+# "If you work in California you get 60 days of PTO" is still checked.
+META_PHRASES = ("if you", "let me know", "i can", "here's", "here’s", "here is", "feel free")
+MIN_TERMS = 3
+
+
+def terms(text: str) -> set[str]:
+    return {t for t in _TERM.findall(text.lower()) if t not in STOPWORDS}
+
+
+def numbers(text: str) -> set[str]:
+    return set(_NUMBER.findall(text))
+
+
+class SentenceBuffer:
+    """Accumulates streamed text and returns sentences as they complete."""
+
+    def __init__(self):
+        self._buf = ""
+
+    def feed(self, delta: str) -> list[str]:
+        self._buf += delta
+        parts = _BOUNDARY.split(self._buf)
+        self._buf = parts.pop()
+        return [p.strip() for p in parts if p.strip()]
+
+    def flush(self) -> list[str]:
+        rest, self._buf = self._buf.strip(), ""
+        return [rest] if rest else []
+
+
+def split_sentences(text: str) -> list[str]:
+    buf = SentenceBuffer()
+    return buf.feed(text) + buf.flush()
+
+
+@dataclass(frozen=True)
+class Retraction:
+    sentence_index: int
+    sentence: str
+    score: float
+    correction: str | None
+
+
+class GroundingIndex:
+    def __init__(self, chunks: list[str]):
+        self.chunks = list(chunks)
+        self._numbers = [numbers(chunk) for chunk in self.chunks]
+        self._postings: dict[str, list[int]] = {}
+        for i, chunk in enumerate(self.chunks):
+            for term in terms(chunk):
+                self._postings.setdefault(term, []).append(i)
+
+    def source_terms(self, sentence: str) -> set[str]:
+        """The sentence's terms that occur in any chunk."""
+        return {t for t in terms(sentence) if t in self._postings}
+
+    def score(self, sentence: str) -> tuple[float, int | None]:
+        """Returns (overlap with the best chunk in [0, 1], that chunk's index)."""
+        sentence_terms = terms(sentence)
+        if not sentence_terms:
+            return 1.0, None
+        hits = [0] * len(self.chunks)
+        for term in sentence_terms:
+            for i in self._postings.get(term, ()):
+                hits[i] += 1
+        if not any(hits):
+            return 0.0, None
+        best = max(range(len(hits)), key=hits.__getitem__)
+        return hits[best] / len(sentence_terms), best
+
+    def supports_numbers(self, sentence: str, chunk_index: int) -> bool:
+        return numbers(sentence) <= self._numbers[chunk_index]
+
+
+def is_checkable(index: GroundingIndex, sentence: str) -> bool:
+    """Headings, short fragments and conversational asides are not checked."""
+    text = _LIST_MARKER.sub("", sentence).lower()
+    if text.endswith(":") or len(terms(text)) < MIN_TERMS:
+        return False
+    if text.startswith(META_PHRASES) and not numbers(text):
+        return len(index.source_terms(text)) >= MIN_TERMS
+    return True
+
+
+def check_sentence(
+    index: GroundingIndex,
+    sentence_index: int,
+    sentence: str,
+    min_overlap: float | None = None,
+) -> Retraction | None:
+    """Returns a Retraction when the sentence is not supported by the chunks."""
+    if not index.chunks or not is_checkable(index, sentence):
+        return None
+    threshold = settings.GUARDRAIL_MIN_OVERLAP if min_overlap is None else min_overlap
+    marker = _LIST_MARKER.match(sentence)
+    prefix = marker.group(0) if marker else ""
+    text = sentence[len(prefix):]
+    score, best = index.score(text)
+    if score >= threshold and (best is None or index.supports_numbers(text, best)):
+        return None
+    correction = prefix + index.chunks[best] if best is not None else None
+    return Retraction(sentence_index=sentence_index, sentence=sentence, score=score, correction=correction)
+
+
+def check_answer(answer: str, chunks: list[str]) -> list[Retraction]:
+    index = GroundingIndex(chunks)
+    checks = (check_sentence(index, i, s) for i, s in enumerate(split_sentences(answer)))
+    return [r for r in checks if r is not None]
+
+
+def apply_retractions(answer: str, retractions: list[Retraction]) -> str:
+    """Replaces each retracted sentence with its correction, or drops it."""
+    for r in retractions:
+        if r.correction:
+            answer = answer.replace(r.sentence, r.correction, 1)
+        else:
+            answer = re.sub(re.escape(r.sentence) + r"[ \t]*\n?", "", answer, count=1)
+    return answer
+
+
+def summarize(sentences: int, retractions: list[Retraction]) -> str:
+    return f"sentences={sentences} retracted={len(retractions)}" + "".join(
+        f"\n[{r.sentence_index}] score={r.score:.2f} {r.sentence}" for r in retractions
+    )
@@ -0,0 +1,67 @@
+"""
+Local intent classification for the planner.
+
+Most traffic falls into a few HR intents. A weighted keyword match runs in
+microseconds; when it is confident, the planner can reuse a cached plan for
+that intent instead of asking the LLM for a new one.
+"""
+import re
+from dataclasses import dataclass
+
+# keyword/phrase -> weight. Strong, intent-specific terms weigh 2; generic ones 1.
+INTENT_KEYWORDS: dict[str, dict[str, int]] = {
+    "pto": {
+        "pto": 2, "paid time off": 2, "vacation": 2, "holiday": 1, "accrue": 2, "accrual": 2,
+        "carryover": 2, "carry over": 2, "days off": 1, "time off": 1, "sick": 1,
+    },
+    "leave": {
+        "leave": 1, "maternity": 2, "paternity": 2, "parental": 2, "bonding": 2, "fmla": 2,
+        "medical leave": 2, "leave of absence": 2, "bereavement": 2,
+    },
+    "approvals": {
+        "approve": 2, "approval": 2, "approvals": 2, "manager": 1, "request": 1,
+        "submit": 1, "sign off": 2, "sign-off": 2, "pending": 1,
+    },
+}
+
+# Shown to the planner when it writes an intent's reusable plan.
+INTENT_TOPICS: dict[str, str] = {
+    "pto": "paid time off: accrual, carryover, vacation and sick time",
+    "leave": "leaves of absence: parental, medical and bereavement leave",
+    "approvals": "submitting time-off requests and getting them approved",
+}
+
+
+@dataclass(frozen=True)
+class IntentMatch:
+    intent: str | None
+    confidence: float
+    scores: dict[str, int]
+
+
+class KeywordIntentClassifier:
+    def __init__(self, keywords: dict[str, dict[str, int]] | None = None):
+        self.keywords = keywords or INTENT_KEYWORDS
+        # Longest phrases first so "medical leave" is matched before "leave".
+        self._patterns = {
+            intent: [
+                (re.compile(rf"\b{re.escape(phrase)}\b"), weight)
+                for phrase, weight in sorted(words.items(), key=lambda kv: -len(kv[0]))
+            ]
+            for intent, words in self.keywords.items()
+        }
+
+    def classify(self, text: str) -> IntentMatch:
+        text = text.lower()
+        scores = {
+            intent: sum(weight for pattern, weight in patterns if pattern.search(text))
+            for intent, patterns in self._patterns.items()
+        }
+        intent, top = max(scores.items(), key=lambda kv: kv[1])
+        if top == 0:
+            return IntentMatch(intent=None, confidence=0.0, scores=scores)
+
+        # Share of the evidence that points at the top intent, damped by +1 so a
+        # single weak keyword is never "confident".
+        confidence = top / (sum(scores.values()) + 1)
+        return IntentMatch(intent=intent, confidence=confidence, scores=scores)
@@ -1,71 +1,128 @@
 from __future__ import annotations
 
+import time
+from functools import lru_cache
 from typing import TypedDict, List, Dict, Any
 
-from langgraph.graph import StateGraph
+from app.agents.intents import INTENT_TOPICS, KeywordIntentClassifier
+from app.agents.plan_cache import plan_cache
+from app.core.config import settings
+from app.llm.client import get_llm_client, usage_record
+from app.tools.registry import get_tool, list_tools, tools_fingerprint
 
-# Compatibility: END location differs across versions
-try:
-    from langgraph.graph import END  # newer versions
-except Exception:
-    END = "__end__"  # fallback used by older internals
+_intent_classifier = KeywordIntentClassifier()
+
+POLICY_SEARCH_TOOL = "mock_policy_kb_search"
 
 
 class AgentState(TypedDict):
     conversation_id: str
     user_message: str
+    intent: str | None
+    intent_confidence: float
+    intent_latency_ms: float
     plan: str
+    plan_source: str  # "template" (cached per intent) or "llm"
+    planner_latency_ms: float
     tool_name: str
     tool_input: Dict[str, Any]
     tool_output: Dict[str, Any]
+    tool_status: str
+    tool_latency_ms: float
     final_answer: str
     events: List[Dict[str, Any]]
+    llm_calls: List[Dict[str, Any]]
+
+
+def _tools_prompt() -> str:
+    return "\n".join(f"- {t.name}: {t.description}" for t in list_tools())
 
 
 def _planner_node(state: AgentState) -> AgentState:
-    plan = (
-        "1) Identify the policy topic\n"
-        "2) Retrieve relevant policy sections\n"
-        "3) Summarize key rules in bullets\n"
-        "4) Highlight edge cases (carryover, eligibility, approvals)\n"
-    )
+    start = time.perf_counter()
+    match = _intent_classifier.classify(state["user_message"])
+    classified = time.perf_counter()
+    confident = match.intent is not None and match.confidence >= settings.PLANNER_INTENT_MIN_CONFIDENCE
+    use_cache = settings.PLANNER_CACHE_ENABLED and confident
+    fingerprint = tools_fingerprint()
+
+    plan = plan_cache.get(match.intent, fingerprint) if use_cache else None
+    if not use_cache:
+        plan_cache.record_bypass()
+
+    source = "template"
+    if plan is None:
+        # Concurrent runs' planner calls may share one provider round-trip. A plan
+        # that will be cached is written for the intent, never for this user's text.
+        if use_cache:
+            response = get_llm_client().complete(
+                "planner_template",
+                batchable=True,
+                tools=_tools_prompt(),
+                intent=match.intent,
+                topic=INTENT_TOPICS.get(match.intent, match.intent),
+            )
+        else:
+            response = get_llm_client().complete("planner", batchable=True, user_message=state["user_message"])
+        plan = response.text
+        source = "llm"
+        state["llm_calls"].append(usage_record("planner", response))
+        if use_cache:
+            plan_cache.put(match.intent, fingerprint, plan)
+
+    state["intent"] = match.intent
+    state["intent_confidence"] = match.confidence
+    state["intent_latency_ms"] = (classified - start) * 1000
     state["plan"] = plan
-    state["events"].append({"type": "planner", "plan": plan})
+    state["plan_source"] = source
+    state["planner_latency_ms"] = (time.perf_counter() - classified) * 1000
+    state["events"].append({"type": "planner", "plan": plan, "intent": match.intent, "plan_source": source})
     return state
 
 
 def _tool_node(state: AgentState) -> AgentState:
-    tool_name = "mock_policy_kb_search"
+    start = time.perf_counter()
+    # Resolved per call, so the tool that runs is the one tools_fingerprint() describes
+    tool = get_tool(POLICY_SEARCH_TOOL)
+    tool_name = tool.name
     tool_input = {"query": state["user_message"]}
-    tool_output = {
-        "top_chunks": [
-            "Employees accrue 20 days PTO per year, with sick time up to 40 hours/year where applicable.",
-            "Baby bonding leave and maternity leave are available; specific durations vary by policy.",
-            "Requests should be submitted in advance; approvals depend on manager coverage needs.",
-        ]
-    }
+    tool_output = tool.run(tool_input)
     state["tool_name"] = tool_name
     state["tool_input"] = tool_input
     state["tool_output"] = tool_output
+    state["tool_status"] = "ok"
+    state["tool_latency_ms"] = (time.perf_counter() - start) * 1000
     state["events"].append({"type": "tool", "tool_name": tool_name, "input": tool_input, "output": tool_output})
     return state
 
 
 def _supervisor_node(state: AgentState) -> AgentState:
     chunks = state.get("tool_output", {}).get("top_chunks", [])
-    summary = (
-        "Here’s a structured summary of the leave policy (based on available policy excerpts):\n\n"
-        "Key rules:\n"
-        + "\n".join([f"- {c}" for c in chunks])
-        + "\n\n"
-        "If you tell me your location (state/country) and employee type, I can tailor the rules to your case."
+    response = get_llm_client().complete(
+        "supervisor",
+        user_message=state["user_message"],
+        plan=state.get("plan", ""),
+        chunks="\n".join(f"- {c}" for c in chunks),
+        chunk_list=chunks,
     )
+    summary = response.text
     state["final_answer"] = summary
+    state["llm_calls"].append(usage_record("supervisor", response))
     state["events"].append({"type": "supervisor", "final_answer": summary})
     return state
 
 
 def build_graph():
+    # LangGraph (and the langchain/langsmith stack behind it) is the single most
+    # expensive import in the app, so it is only loaded when a graph is built.
+    from langgraph.graph import StateGraph
+
+    # Compatibility: END location differs across versions
+    try:
+        from langgraph.graph import END  # newer versions
+    except Exception:
+        END = "__end__"  # fallback used by older internals
+
     g = StateGraph(AgentState)
     g.add_node("planner", _planner_node)
     g.add_node("tool", _tool_node)
@@ -79,21 +136,71 @@ def build_graph():
     return g.compile()
 
 
-GRAPH = build_graph()
+@lru_cache(maxsize=1)
+def get_graph():
+    """Compiled graph, built on first use and shared afterwards."""
+    return build_graph()
 
 
-def run_langgraph_agent(conversation_id: str, user_message: str) -> AgentState:
-    init_state: AgentState = {
+def _init_state(conversation_id: str, user_message: str) -> AgentState:
+    return {
         "conversation_id": conversation_id,
         "user_message": user_message,
+        "intent": None,
+        "intent_confidence": 0.0,
+        "intent_latency_ms": 0.0,
         "plan": "",
+        "plan_source": "",
+        "planner_latency_ms": 0.0,
         "tool_name": "",
         "tool_input": {},
         "tool_output": {},
+        "tool_status": "",
+        "tool_latency_ms": 0.0,
         "final_answer": "",
         "events": [],
+        "llm_calls": [],
     }
-    return GRAPH.invoke(init_state)
+
+
+def run_langgraph_agent(conversation_id: str, user_message: str) -> AgentState:
+    return get_graph().invoke(_init_state(conversation_id, user_message))
+
+
+def _node_events(node_name: str, node_state: Dict[str, Any]):
+    yield ("node", {"node": node_name})
+
+    if node_name == "planner":
+        yield (
+            "planner",
+            {
+                "plan": node_state.get("plan", ""),
+                "intent": node_state.get("intent"),
+                "intent_confidence": node_state.get("intent_confidence", 0.0),
+                "intent_latency_ms": node_state.get("intent_latency_ms"),
+                "plan_source": node_state.get("plan_source", ""),
+                "latency_ms": node_state.get("planner_latency_ms"),
+            },
+        )
+
+    elif node_name == "tool":
+        yield (
+            "tool",
+            {
+                "tool_name": node_state.get("tool_name", ""),
+                "input": node_state.get("tool_input", {}),
+                "output": node_state.get("tool_output", {}),
+                "status": node_state.get("tool_status", "ok"),
+                "latency_ms": node_state.get("tool_latency_ms"),
+            },
+        )
+
+    elif node_name == "supervisor":
+        yield ("final", {"final_answer": node_state.get("final_answer", "")})
+
+    for call in node_state.get("llm_calls", []):
+        if call.get("node") == node_name:
+            yield ("llm_call", call)
 
 
 def stream_langgraph_agent(conversation_id: str, user_message: str):
@@ -101,59 +208,15 @@ def stream_langgraph_agent(conversation_id: str, user_message: str):
     Streams node-level events in a version-tolerant way.
     Some LangGraph versions stream dicts; some stream tuples.
     """
-    init_state: AgentState = {
-        "conversation_id": conversation_id,
-        "user_message": user_message,
-        "plan": "",
-        "tool_name": "",
-        "tool_input": {},
-        "tool_output": {},
-        "final_answer": "",
-        "events": [],
-    }
-
-    stream_iter = GRAPH.stream(init_state)
+    stream_iter = get_graph().stream(_init_state(conversation_id, user_message))
 
     for item in stream_iter:
         # Newer: {"planner": state} dict
         if isinstance(item, dict):
             for node_name, node_state in item.items():
-                yield ("node", {"node": node_name})
-
-                if node_name == "planner":
-                    yield ("planner", {"plan": node_state.get("plan", "")})
-
-                elif node_name == "tool":
-                    yield (
-                        "tool",
-                        {
-                            "tool_name": node_state.get("tool_name", ""),
-                            "input": node_state.get("tool_input", {}),
-                            "output": node_state.get("tool_output", {}),
-                        },
-                    )
-
-                elif node_name == "supervisor":
-                    yield ("final", {"final_answer": node_state.get("final_answer", "")})
+                yield from _node_events(node_name, node_state or {})
 
         # Older: (node_name, state) tuple
         elif isinstance(item, tuple) and len(item) == 2:
             node_name, node_state = item
-            yield ("node", {"node": str(node_name)})
-            node_state = node_state or {}
-
-            if str(node_name) == "planner":
-                yield ("planner", {"plan": node_state.get("plan", "")})
-
-            elif str(node_name) == "tool":
-                yield (
-                    "tool",
-                    {
-                        "tool_name": node_state.get("tool_name", ""),
-                        "input": node_state.get("tool_input", {}),
-                        "output": node_state.get("tool_output", {}),
-                    },
-                )
-
-            elif str(node_name) == "supervisor":
-                yield ("final", {"final_answer": node_state.get("final_answer", "")})
+            yield from _node_events(str(node_name), node_state or {})
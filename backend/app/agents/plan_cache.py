@@ -0,0 +1,76 @@
+import threading
+from dataclasses import dataclass
+
+
+@dataclass
+class PlanCacheStats:
+    hits: int = 0
+    misses: int = 0
+    bypassed: int = 0  # low-confidence / unclassified requests that skip the cache
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class PlanCache:
+    """
+    Plan templates per intent, scoped to the current tool set: entries are
+    keyed by (intent, tools fingerprint) and the whole cache is dropped when
+    the fingerprint changes. In-process only; each worker warms its own.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._plans: dict[str, str] = {}
+        self._fingerprint: str | None = None
+        self.stats = PlanCacheStats()
+
+    def _check_fingerprint(self, fingerprint: str) -> None:
+        if fingerprint != self._fingerprint:
+            if self._plans:
+                self.stats.invalidations += 1
+            self._plans.clear()
+            self._fingerprint = fingerprint
+
+    def get(self, intent: str, fingerprint: str) -> str | None:
+        with self._lock:
+            self._check_fingerprint(fingerprint)
+            plan = self._plans.get(intent)
+            if plan is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+            return plan
+
+    def put(self, intent: str, fingerprint: str, plan: str) -> None:
+        with self._lock:
+            self._check_fingerprint(fingerprint)
+            self._plans[intent] = plan
+
+    def record_bypass(self) -> None:
+        with self._lock:
+            self.stats.bypassed += 1
+
+    def invalidate(self) -> None:
+        with self._lock:
+            if self._plans:
+                self.stats.invalidations += 1
+            self._plans.clear()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.stats.hits,
+                "misses": self.stats.misses,
+                "bypassed": self.stats.bypassed,
+                "invalidations": self.stats.invalidations,
+                "hit_rate": self.stats.hit_rate,
+                "entries": sorted(self._plans),
+                "tools_fingerprint": self._fingerprint,
+            }
+
+
+plan_cache = PlanCache()
@@ -0,0 +1,68 @@
+"""
+DDSketch-style latency sketch: log-spaced buckets with a fixed relative error.
+
+Values v > 0 land in bucket ceil(log_gamma(v)), gamma = (1 + a) / (1 - a), so
+any quantile is reported within a relative error `a` of the true value. Two
+sketches merge by adding bucket counts, which is what lets hourly aggregates
+be combined into arbitrary time ranges without touching raw rows.
+"""
+import math
+
+DEFAULT_ALPHA = 0.01
+_MIN_VALUE = 1e-3  # values at or below this (ms) are counted as zero
+
+
+class LatencySketch:
+    __slots__ = ("alpha", "gamma", "_log_gamma", "zero_count", "bins")
+
+    def __init__(self, alpha: float = DEFAULT_ALPHA):
+        self.alpha = alpha
+        self.gamma = (1 + alpha) / (1 - alpha)
+        self._log_gamma = math.log(self.gamma)
+        self.zero_count = 0
+        self.bins: dict[int, int] = {}
+
+    @property
+    def count(self) -> int:
+        return self.zero_count + sum(self.bins.values())
+
+    def add(self, value: float, n: int = 1) -> None:
+        if value <= _MIN_VALUE:
+            self.zero_count += n
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self.bins[key] = self.bins.get(key, 0) + n
+
+    def merge(self, other: "LatencySketch") -> None:
+        if other.alpha != self.alpha:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        self.zero_count += other.zero_count
+        for key, n in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + n
+
+    def quantile(self, q: float) -> float | None:
+        total = self.count
+        if total == 0:
+            return None
+        rank = q * (total - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                # midpoint (in relative terms) of the bucket (gamma^(k-1), gamma^k]
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.bins) / (self.gamma + 1)
+
+    def to_dict(self) -> dict:
+        return {"alpha": self.alpha, "zero": self.zero_count, "bins": {str(k): n for k, n in self.bins.items()}}
+
+    @classmethod
+    def from_dict(cls, data: dict | None) -> "LatencySketch":
+        if not data:
+            return cls()
+        sketch = cls(data.get("alpha", DEFAULT_ALPHA))
+        sketch.zero_count = data.get("zero", 0)
+        sketch.bins = {int(k): n for k, n in data.get("bins", {}).items()}
+        return sketch
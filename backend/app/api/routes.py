@@ -2,8 +2,14 @@ from fastapi import APIRouter
 from app.api.v1.health import router as health_router
 from app.api.v1.tasks import router as tasks_router
 from app.api.v1.conversations import router as conversations_router
+from app.api.v1.bulk import router as bulk_router
+from app.api.v1.agents import router as agents_router
+from app.api.v1.analytics import router as analytics_router
 
 router = APIRouter()
 router.include_router(health_router, tags=["health"])
 router.include_router(tasks_router, tags=["tasks"])
 router.include_router(conversations_router, tags=["conversations"])
+router.include_router(bulk_router, tags=["bulk"])
+router.include_router(agents_router, tags=["agents"])
+router.include_router(analytics_router, tags=["analytics"])
@@ -1,10 +1,31 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class AgentRunRequest(BaseModel):
     user_message: str
 
 
+class RetractionOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    sentence_index: int
+    sentence: str
+    score: float
+    correction: str | None = None
+
+
 class AgentRunResponse(BaseModel):
     conversation_id: str
     assistant_message: str
+    # Unsupported sentences already replaced/removed in assistant_message
+    retractions: list[RetractionOut] = []
+
+
+class PlanCacheStatsOut(BaseModel):
+    hits: int
+    misses: int
+    bypassed: int
+    invalidations: int
+    hit_rate: float
+    entries: list[str]
+    tools_fingerprint: str | None
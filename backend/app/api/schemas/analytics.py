@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel
+
+Granularity = Literal["total", "hour"]
+
+
+class AggregateOut(BaseModel):
+    name: str
+    bucket_start: datetime | None = None  # set when granularity="hour"
+    count: int
+    error_count: int
+    error_rate: float
+    latency_mean_ms: float | None = None
+    latency_p50_ms: float | None = None
+    latency_p95_ms: float | None = None
+    latency_p99_ms: float | None = None
+
+
+class AnalyticsOut(BaseModel):
+    kind: str
+    since: datetime
+    until: datetime
+    granularity: Granularity
+    # Raw rows newer than this are not yet folded into the aggregates
+    fresh_until: datetime | None = None
+    items: list[AggregateOut]
@@ -0,0 +1,5 @@
+from pydantic import BaseModel
+
+
+class BulkImportResult(BaseModel):
+    imported: dict[str, int]
@@ -9,20 +9,48 @@ class TraceStepOut(BaseModel):
     conversation_id: str
     step_type: str
     content: str
+    latency_ms: float | None = None
     created_at: datetime
 
 
+class PayloadSummary(BaseModel):
+    size_bytes: int
+    compressed: bool
+    blob_hash: str | None = None
+
+
 class ToolCallOut(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
     id: str
     conversation_id: str
     tool_name: str
-    input_payload: dict | None
-    output_payload: dict | None
+    input_summary: PayloadSummary | None = None
+    output_summary: PayloadSummary | None = None
+    # Only populated when the telemetry endpoint is called with include_payloads=true
+    input_payload: dict | None = None
+    output_payload: dict | None = None
+    status: str = "ok"
+    latency_ms: float | None = None
+    created_at: datetime
+
+
+class LLMCallOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    conversation_id: str
+    node: str
+    provider: str
+    model: str
+    prompt_tokens: int
+    completion_tokens: int
+    latency_ms: float
+    batch_size: int
     created_at: datetime
 
 
 class TelemetryOut(BaseModel):
     trace_steps: list[TraceStepOut]
     tool_calls: list[ToolCallOut]
+    llm_calls: list[LLMCallOut] = []
@@ -0,0 +1,28 @@
+"""
+Fast response path for list-heavy endpoints.
+
+Routes return `typed_json_response(Model, data)` instead of letting FastAPI
+validate and encode the payload field by field: the whole payload is
+validated once through a cached TypeAdapter and dumped straight to JSON
+bytes by pydantic-core. `data` may contain SQLAlchemy Rows from column-only
+selects; models with from_attributes read them without building ORM objects.
+"""
+from functools import lru_cache
+from typing import Any
+
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def type_adapter(tp: Any) -> TypeAdapter:
+    return TypeAdapter(tp)
+
+
+def dump_json(tp: Any, data: Any) -> bytes:
+    adapter = type_adapter(tp)
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+
+
+def typed_json_response(tp: Any, data: Any, status_code: int = 200) -> Response:
+    return Response(content=dump_json(tp, data), status_code=status_code, media_type="application/json")
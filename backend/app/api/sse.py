@@ -0,0 +1,19 @@
+"""Server-sent event frames, encoded with orjson straight to bytes."""
+from functools import lru_cache
+
+import orjson
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
+
+@lru_cache(maxsize=64)
+def _prefix(event: str) -> bytes:
+    return f"event: {event}\ndata: ".encode()
+
+
+def sse_frame(event: str, data: dict) -> bytes:
+    return _prefix(event) + orjson.dumps(data) + b"\n\n"
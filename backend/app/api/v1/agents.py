@@ -0,0 +1,18 @@
+from fastapi import APIRouter
+
+from app.agents.plan_cache import plan_cache
+from app.api.schemas.agent import PlanCacheStatsOut
+
+router = APIRouter()
+
+
+@router.get("/agents/planner/cache", response_model=PlanCacheStatsOut)
+def get_plan_cache_stats():
+    """Template hit rate of the intent plan cache in this process."""
+    return plan_cache.snapshot()
+
+
+@router.delete("/agents/planner/cache", response_model=PlanCacheStatsOut)
+def clear_plan_cache():
+    plan_cache.invalidate()
+    return plan_cache.snapshot()
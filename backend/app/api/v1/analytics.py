@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.api.schemas.analytics import AnalyticsOut, Granularity
+from app.api.serialization import typed_json_response
+from app.core.config import settings
+from app.db.crud.analytics import SOURCE_OF_KIND, get_fresh_until, query_aggregates
+from app.db.session import get_db
+
+router = APIRouter()
+
+
+def _analytics(db: Session, kind: str, since, until, granularity: Granularity):
+    until = until or datetime.utcnow()
+    since = since or until - timedelta(days=settings.ANALYTICS_DEFAULT_WINDOW_DAYS)
+    data = {
+        "kind": kind,
+        "since": since,
+        "until": until,
+        "granularity": granularity,
+        "fresh_until": get_fresh_until(db, SOURCE_OF_KIND[kind]),
+        "items": query_aggregates(db, kind, since, until, by_hour=granularity == "hour"),
+    }
+    return typed_json_response(AnalyticsOut, data)
+
+
+@router.get("/analytics/tools", response_model=AnalyticsOut)
+def tool_analytics(
+    since: datetime | None = None,
+    until: datetime | None = None,
+    granularity: Granularity = "total",
+    db: Session = Depends(get_db),
+):
+    """Per-tool call counts, error rates and latency percentiles across conversations."""
+    return _analytics(db, "tool", since, until, granularity)
+
+
+@router.get("/analytics/steps", response_model=AnalyticsOut)
+def step_analytics(
+    since: datetime | None = None,
+    until: datetime | None = None,
+    granularity: Granularity = "total",
+    db: Session = Depends(get_db),
+):
+    """Per-step-type counts, error rates and latency (measured where each step ran)."""
+    return _analytics(db, "step", since, until, granularity)
+
+
+@router.get("/analytics/llm", response_model=AnalyticsOut)
+def llm_analytics(
+    since: datetime | None = None,
+    until: datetime | None = None,
+    granularity: Granularity = "total",
+    db: Session = Depends(get_db),
+):
+    """Per-node LLM call counts and latency percentiles."""
+    return _analytics(db, "llm", since, until, granularity)
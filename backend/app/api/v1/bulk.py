@@ -0,0 +1,57 @@
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.api.schemas.bulk import BulkImportResult
+from app.core.ndjson import check_codec, codec_from_filename, compress_chunks, decode_line, encode_line, iter_lines
+from app.db.crud.bulk import import_records, iter_export_records
+from app.db.session import SessionLocal, get_db
+
+router = APIRouter()
+
+_EXTENSIONS = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+
+@router.get("/bulk/export")
+def bulk_export_route(
+    since: datetime | None = None,
+    until: datetime | None = None,
+    compression: str = "none",
+):
+    try:
+        check_codec(compression)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    def body():
+        # Own session: the request-scoped one is closed before the body is streamed.
+        db = SessionLocal()
+        try:
+            lines = (encode_line(r) for r in iter_export_records(db, since=since, until=until))
+            yield from compress_chunks(lines, compression)
+        finally:
+            db.close()
+
+    filename = f"export.ndjson{_EXTENSIONS[compression]}"
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    return StreamingResponse(body(), media_type="application/x-ndjson", headers=headers)
+
+
+@router.post("/bulk/import", response_model=BulkImportResult)
+def bulk_import_route(
+    file: UploadFile = File(...),
+    compression: str | None = None,
+    db: Session = Depends(get_db),
+):
+    codec = compression or codec_from_filename(file.filename)
+    try:
+        check_codec(codec)
+        records = (decode_line(line) for line in iter_lines(file.file, codec))
+        counts = import_records(db, records)
+    except ValueError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return BulkImportResult(imported=counts)
@@ -1,9 +1,20 @@
 import asyncio
-import json
-
+import time
+
+from app.agents.guardrails import (
+    GroundingIndex,
+    SentenceBuffer,
+    apply_retractions,
+    check_answer,
+    check_sentence,
+    split_sentences,
+    summarize,
+)
 from app.agents.langgraph_agent import run_langgraph_agent, stream_langgraph_agent
+from app.core.config import settings
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
+from starlette.concurrency import iterate_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
@@ -18,14 +29,26 @@ from app.api.schemas.message import MessageCreate, MessageOut
 from app.api.schemas.history import ConversationHistory
 
 from app.api.schemas.agent import AgentRunRequest, AgentRunResponse
-from app.db.crud.telemetry import log_trace_step, log_tool_call
+from app.db.crud.telemetry import log_llm_calls, log_trace_step, log_tool_call
 from app.agents.simple_agent import run_simple_agent
 
 from app.api.schemas.telemetry import TelemetryOut
-from app.db.crud.telemetry_read import list_trace_steps, list_tool_calls
+from app.api.serialization import typed_json_response
+from app.api.sse import SSE_HEADERS, sse_frame
+from app.db.crud.telemetry_read import list_llm_calls, list_trace_steps, list_tool_calls
 
 router = APIRouter()
 
+STREAM_CHUNK_WORDS = 10
+
+
+def _intent_summary(state: dict) -> str:
+    return (
+        f"intent={state.get('intent') or 'none'} "
+        f"confidence={state.get('intent_confidence', 0.0):.2f} "
+        f"plan_source={state.get('plan_source') or 'llm'}"
+    )
+
 
 @router.post("/conversations", response_model=ConversationOut)
 def create_conversation_route(payload: ConversationCreate, db: Session = Depends(get_db)):
@@ -51,7 +74,7 @@ def get_history_route(conversation_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Conversation not found")
 
     msgs = list_messages(db, conversation_id)
-    return {"conversation": conv, "messages": msgs}
+    return typed_json_response(ConversationHistory, {"conversation": conv, "messages": msgs})
 
 @router.post("/conversations/{conversation_id}/run", response_model=AgentRunResponse)
 def run_agent_route(conversation_id: str, payload: AgentRunRequest, db: Session = Depends(get_db)):
@@ -59,6 +82,7 @@ def run_agent_route(conversation_id: str, payload: AgentRunRequest, db: Session
     if not conv:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
+    started = time.perf_counter()
     # Persist user message
     add_message(db, conversation_id=conversation_id, role="user", content=payload.user_message)
     log_trace_step(db, conversation_id, "agent_start", "Starting LangGraph agent run")
@@ -66,9 +90,12 @@ def run_agent_route(conversation_id: str, payload: AgentRunRequest, db: Session
     # Run graph
     result_state = run_langgraph_agent(conversation_id, payload.user_message)
 
-    # Log node outputs to trace_steps + tool_calls
+    # Log node outputs to trace_steps + tool_calls, with the latencies measured in the nodes
     if result_state.get("plan"):
-        log_trace_step(db, conversation_id, "planner", result_state["plan"])
+        log_trace_step(
+            db, conversation_id, "intent", _intent_summary(result_state), result_state.get("intent_latency_ms")
+        )
+        log_trace_step(db, conversation_id, "planner", result_state["plan"], result_state.get("planner_latency_ms"))
 
     if result_state.get("tool_name"):
         log_tool_call(
@@ -77,14 +104,44 @@ def run_agent_route(conversation_id: str, payload: AgentRunRequest, db: Session
             tool_name=result_state["tool_name"],
             input_payload=result_state.get("tool_input", {}),
             output_payload=result_state.get("tool_output", {}),
+            status=result_state.get("tool_status") or "ok",
+            latency_ms=result_state.get("tool_latency_ms"),
         )
-        log_trace_step(db, conversation_id, "tool_call", f"Executed {result_state['tool_name']}")
+        log_trace_step(
+            db,
+            conversation_id,
+            "tool_call",
+            f"Executed {result_state['tool_name']}",
+            result_state.get("tool_latency_ms"),
+        )
+
+    log_llm_calls(db, conversation_id, result_state.get("llm_calls", []))
 
     assistant_text = result_state.get("final_answer", "")
-    add_message(db, conversation_id=conversation_id, role="assistant", content=assistant_text)
-    log_trace_step(db, conversation_id, "agent_end", "Completed LangGraph agent run")
+    retractions = []
+    if settings.GUARDRAIL_ENABLED:
+        chunks = result_state.get("tool_output", {}).get("top_chunks", [])
+        checked = time.perf_counter()
+        retractions = check_answer(assistant_text, chunks)
+        log_trace_step(
+            db,
+            conversation_id,
+            "guardrail",
+            summarize(len(split_sentences(assistant_text)), retractions),
+            (time.perf_counter() - checked) * 1000,
+        )
+        assistant_text = apply_retractions(assistant_text, retractions)
 
-    return AgentRunResponse(conversation_id=conversation_id, assistant_message=assistant_text)
+    add_message(db, conversation_id=conversation_id, role="assistant", content=assistant_text)
+    log_trace_step(
+        db, conversation_id, "agent_end", "Completed LangGraph agent run", (time.perf_counter() - started) * 1000
+    )
+
+    return AgentRunResponse(
+        conversation_id=conversation_id,
+        assistant_message=assistant_text,
+        retractions=retractions,
+    )
 @router.post("/conversations/{conversation_id}/run/stream")
 def run_agent_stream_route(conversation_id: str, payload: AgentRunRequest, db: Session = Depends(get_db)):
     conv = get_conversation(db, conversation_id)
@@ -94,24 +151,63 @@ def run_agent_stream_route(conversation_id: str, payload: AgentRunRequest, db: S
     add_message(db, conversation_id=conversation_id, role="user", content=payload.user_message)
 
     async def event_generator():
-        def sse(event: str, data: dict) -> str:
-            return f"event: {event}\ndata: {json.dumps(data)}\n\n"
-
+        started = time.perf_counter()
         try:
             log_trace_step(db, conversation_id, "agent_start", "Starting LangGraph streamed run")
-            yield sse("agent_start", {"conversation_id": conversation_id})
+            yield sse_frame("agent_start", {"conversation_id": conversation_id})
 
             final_answer = ""
-
-            # Stream LangGraph node events
-            for event_name, payload_dict in stream_langgraph_agent(conversation_id, payload.user_message):
+            grounding = None
+            sentences = SentenceBuffer()
+            sentence_count = 0
+            pending_checks: list[asyncio.Task] = []
+            retractions = []
+            guardrail_ms = 0.0
+
+            def timed_check(sentence_index: int, sentence: str):
+                checked = time.perf_counter()
+                retraction = check_sentence(grounding, sentence_index, sentence)
+                return retraction, (time.perf_counter() - checked) * 1000
+
+            def check_completed(new_sentences: list[str]) -> None:
+                # Sentences are checked off the event loop while later tokens keep streaming
+                nonlocal sentence_count
+                for sentence in new_sentences:
+                    pending_checks.append(asyncio.create_task(asyncio.to_thread(timed_check, sentence_count, sentence)))
+                    sentence_count += 1
+
+            def retraction_frames(checks: list) -> list[bytes]:
+                # Also totals the time spent checking, which is the guardrail step's latency
+                nonlocal guardrail_ms
+                frames = []
+                for retraction, elapsed_ms in checks:
+                    guardrail_ms += elapsed_ms
+                    if retraction is not None:
+                        retractions.append(retraction)
+                        frames.append(sse_frame("retraction", retraction))
+                return frames
+
+            # Stream LangGraph node events. The graph makes blocking LLM calls, so each
+            # step runs in the thread pool (where batchable calls can also coalesce
+            # with other runs) instead of on the event loop.
+            graph_events = iterate_in_threadpool(stream_langgraph_agent(conversation_id, payload.user_message))
+            async for event_name, payload_dict in graph_events:
                 if event_name == "node":
                     log_trace_step(db, conversation_id, "node", f"Entered node: {payload_dict['node']}")
-                    yield sse("node", payload_dict)
+                    yield sse_frame("node", payload_dict)
 
                 elif event_name == "planner":
-                    log_trace_step(db, conversation_id, "planner", payload_dict.get("plan", ""))
-                    yield sse("planner", payload_dict)
+                    log_trace_step(
+                        db,
+                        conversation_id,
+                        "intent",
+                        _intent_summary(payload_dict),
+                        payload_dict.get("intent_latency_ms"),
+                    )
+                    log_trace_step(
+                        db, conversation_id, "planner", payload_dict.get("plan", ""), payload_dict.get("latency_ms")
+                    )
+                    yield sse_frame("planner", payload_dict)
 
                 elif event_name == "tool":
                     tool_name = payload_dict.get("tool_name", "")
@@ -121,47 +217,100 @@ def run_agent_stream_route(conversation_id: str, payload: AgentRunRequest, db: S
                         tool_name=tool_name,
                         input_payload=payload_dict.get("input", {}),
                         output_payload=payload_dict.get("output", {}),
+                        status=payload_dict.get("status") or "ok",
+                        latency_ms=payload_dict.get("latency_ms"),
+                    )
+                    log_trace_step(
+                        db, conversation_id, "tool_call", f"Executed {tool_name}", payload_dict.get("latency_ms")
                     )
-                    log_trace_step(db, conversation_id, "tool_call", f"Executed {tool_name}")
-                    yield sse("tool_call", {"tool_name": tool_name, "status": "ok"})
+                    yield sse_frame("tool_call", {"tool_name": tool_name, "status": payload_dict.get("status") or "ok"})
+                    if settings.GUARDRAIL_ENABLED:
+                        # Indexed before generation, so checks only cost a lookup per sentence
+                        grounding = GroundingIndex(payload_dict.get("output", {}).get("top_chunks", []))
+
+                elif event_name == "llm_call":
+                    log_llm_calls(db, conversation_id, [payload_dict])
 
                 elif event_name == "final":
                     final_answer = payload_dict.get("final_answer", "")
                     # Stream the final answer word-by-word (works nicely with your UI)
                     words = final_answer.split(" ")
                     built = []
-                    for i, w in enumerate(words):
+                    chunk = []
+                    for w in words:
                         built.append(w)
+                        chunk.append(w)
                         partial = " ".join(built)
-                        if i % 10 == 0:
-                            log_trace_step(db, conversation_id, "stream_chunk", partial)
-                        yield sse("token", {"delta": w + " ", "partial": partial})
+                        # Persist deltas, not the cumulative text, so storage stays linear
+                        if len(chunk) == STREAM_CHUNK_WORDS:
+                            log_trace_step(db, conversation_id, "stream_chunk", " ".join(chunk))
+                            chunk = []
+                        yield sse_frame("token", {"delta": w + " ", "partial": partial})
+                        if grounding is not None:
+                            check_completed(sentences.feed(w + " "))
+                            done = [t for t in pending_checks if t.done()]
+                            for t in done:
+                                pending_checks.remove(t)
+                            for frame in retraction_frames([t.result() for t in done]):
+                                yield frame
                         await asyncio.sleep(0.02)
+                    if chunk:
+                        log_trace_step(db, conversation_id, "stream_chunk", " ".join(chunk))
+
+                    if grounding is not None:
+                        # Usually only the last sentence's check is still in flight here
+                        check_completed(sentences.flush())
+                        for frame in retraction_frames(await asyncio.gather(*pending_checks)):
+                            yield frame
+                        pending_checks.clear()
+                        retractions.sort(key=lambda r: r.sentence_index)
+                        log_trace_step(
+                            db, conversation_id, "guardrail", summarize(sentence_count, retractions), guardrail_ms
+                        )
+                        final_answer = apply_retractions(final_answer, retractions)
 
             # Persist assistant message at end
             add_message(db, conversation_id=conversation_id, role="assistant", content=final_answer)
 
-            log_trace_step(db, conversation_id, "agent_end", "Completed LangGraph streamed run")
-            yield sse("agent_end", {"conversation_id": conversation_id, "status": "done"})
+            log_trace_step(
+                db,
+                conversation_id,
+                "agent_end",
+                "Completed LangGraph streamed run",
+                (time.perf_counter() - started) * 1000,
+            )
+            yield sse_frame(
+                "agent_end",
+                {"conversation_id": conversation_id, "status": "done", "retractions": len(retractions)},
+            )
 
         except Exception as e:
             log_trace_step(db, conversation_id, "agent_error", str(e))
-            yield sse("error", {"message": str(e)})
+            yield sse_frame("error", {"message": str(e)})
+
+        finally:
+            # get_db has already torn down by the time the body streams; close here
+            # so the connection is not left idle in transaction, which would block
+            # partition DDL on trace_steps.
+            db.close()
 
-    headers = {
-        "Cache-Control": "no-cache",
-        "Connection": "keep-alive",
-        "X-Accel-Buffering": "no",
-    }
-    return StreamingResponse(event_generator(), media_type="text/event-stream", headers=headers)
+    return StreamingResponse(event_generator(), media_type="text/event-stream", headers=SSE_HEADERS)
 
 @router.get("/conversations/{conversation_id}/telemetry", response_model=TelemetryOut)
-def get_telemetry_route(conversation_id: str, db: Session = Depends(get_db)):
+def get_telemetry_route(
+    conversation_id: str,
+    include_payloads: bool = False,
+    db: Session = Depends(get_db),
+):
     conv = get_conversation(db, conversation_id)
     if not conv:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    return {
-        "trace_steps": list_trace_steps(db, conversation_id),
-        "tool_calls": list_tool_calls(db, conversation_id),
-    }
+    return typed_json_response(
+        TelemetryOut,
+        {
+            "trace_steps": list_trace_steps(db, conversation_id),
+            "tool_calls": list_tool_calls(db, conversation_id, include_payloads=include_payloads),
+            "llm_calls": list_llm_calls(db, conversation_id),
+        },
+    )
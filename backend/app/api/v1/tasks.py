@@ -1,15 +1,20 @@
 from fastapi import APIRouter
-from app.tasks.example_tasks import ping
 
 router = APIRouter()
 
+# Celery is imported on first use so API startup does not pay for it.
+
 @router.post("/tasks/ping")
 def enqueue_ping():
+    from app.tasks.example_tasks import ping
+
     job = ping.delay()
     return {"task_id": job.id, "status": "queued"}
 
 @router.get("/tasks/{task_id}")
 def get_task_status(task_id: str):
+    from app.tasks.example_tasks import ping
+
     res = ping.AsyncResult(task_id)
     payload = {"task_id": task_id, "state": res.state}
     if res.successful():
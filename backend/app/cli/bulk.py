@@ -0,0 +1,70 @@
+"""
+Bulk NDJSON export/import of conversations and telemetry.
+
+    python -m app.cli.bulk export -o day.ndjson.gz --since 2026-10-18 --until 2026-10-19
+    python -m app.cli.bulk import -i day.ndjson.gz
+
+Compression is inferred from the file extension (.gz / .zst) unless --compression is given.
+"""
+import argparse
+import sys
+from datetime import datetime
+
+from app.core.ndjson import CODECS, codec_from_filename, compress_chunks, decode_line, encode_line, iter_lines
+from app.db.crud.bulk import DEFAULT_BATCH_SIZE, import_records, iter_export_records
+from app.db.session import SessionLocal
+
+
+def _export(args: argparse.Namespace) -> None:
+    codec = args.compression or codec_from_filename(args.output)
+    out = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    db = SessionLocal()
+    try:
+        lines = (encode_line(r) for r in iter_export_records(db, since=args.since, until=args.until))
+        for chunk in compress_chunks(lines, codec):
+            out.write(chunk)
+    finally:
+        db.close()
+        if out is not sys.stdout.buffer:
+            out.close()
+
+
+def _import(args: argparse.Namespace) -> None:
+    codec = args.compression or codec_from_filename(args.input)
+    src = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+    db = SessionLocal()
+    try:
+        records = (decode_line(line) for line in iter_lines(src, codec))
+        counts = import_records(db, records, batch_size=args.batch_size)
+    finally:
+        db.close()
+        if src is not sys.stdin.buffer:
+            src.close()
+
+    for table, n in counts.items():
+        print(f"{table}: {n}", file=sys.stderr)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.cli.bulk")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    exp = sub.add_parser("export", help="stream rows as NDJSON")
+    exp.add_argument("-o", "--output", default="-")
+    exp.add_argument("--since", type=datetime.fromisoformat)
+    exp.add_argument("--until", type=datetime.fromisoformat)
+    exp.add_argument("--compression", choices=CODECS)
+    exp.set_defaults(func=_export)
+
+    imp = sub.add_parser("import", help="load an NDJSON export")
+    imp.add_argument("-i", "--input", default="-")
+    imp.add_argument("--compression", choices=CODECS)
+    imp.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    imp.set_defaults(func=_import)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
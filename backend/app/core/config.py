@@ -19,6 +19,37 @@ class Settings(BaseSettings):
 
     OPENAI_API_KEY: str = ""
 
+    # LLM client; "auto" uses OpenAI when OPENAI_API_KEY is set, else the local fake provider
+    LLM_PROVIDER: str = "auto"
+    LLM_MODEL: str = "gpt-4o-mini"
+    LLM_BASE_URL: str = "https://api.openai.com/v1"
+    LLM_TIMEOUT_S: float = 30.0
+    LLM_MAX_CONNECTIONS: int = 20
+    LLM_MAX_RETRIES: int = 3
+    LLM_BATCH_MAX_SIZE: int = 8
+    LLM_BATCH_MAX_WAIT_MS: float = 5.0
+
+    # Planner reuses a cached plan for intents classified with at least this confidence
+    PLANNER_CACHE_ENABLED: bool = True
+    PLANNER_INTENT_MIN_CONFIDENCE: float = 0.6
+
+    # Answer sentences sharing less than this fraction of their terms with a
+    # retrieved chunk are retracted (app.agents.guardrails)
+    GUARDRAIL_ENABLED: bool = True
+    GUARDRAIL_MIN_OVERLAP: float = 0.5
+
+    # Telemetry storage (trace_steps / tool_calls are partitioned by day on Postgres)
+    TELEMETRY_RETENTION_DAYS: int = 30
+    TELEMETRY_ROLLUP_AFTER_DAYS: int = 7
+    TELEMETRY_PARTITION_PREMAKE_DAYS: int = 7
+
+    # Tool payloads larger than this (serialized bytes) are stored compressed out of line
+    TOOL_PAYLOAD_INLINE_MAX_BYTES: int = 2048
+
+    # Cross-conversation analytics: hourly aggregates refreshed by Celery beat
+    ANALYTICS_REFRESH_INTERVAL_S: float = 60.0
+    ANALYTICS_DEFAULT_WINDOW_DAYS: int = 7
+
     @property
     def database_url(self) -> str:
         return (
@@ -0,0 +1,94 @@
+import io
+import zlib
+from typing import IO, Any, Iterable, Iterator
+
+import orjson
+
+CODECS = ("none", "gzip", "zstd")
+
+_CHUNK_SIZE = 64 * 1024
+
+
+def _default(value: Any) -> Any:
+    # orjson handles datetimes natively; bytes (payload blobs) go out as hex
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).hex()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_line(record: dict) -> bytes:
+    return orjson.dumps(record, default=_default, option=orjson.OPT_APPEND_NEWLINE)
+
+
+def decode_line(line: bytes) -> dict:
+    return orjson.loads(line)
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ValueError("zstd compression requires the 'zstandard' package") from e
+    return zstandard
+
+
+def check_codec(codec: str) -> None:
+    if codec not in CODECS:
+        raise ValueError(f"compression must be one of {', '.join(CODECS)}")
+    if codec == "zstd":
+        _zstd()
+
+
+def codec_from_filename(name: str | None) -> str:
+    if name and name.endswith(".gz"):
+        return "gzip"
+    if name and name.endswith(".zst"):
+        return "zstd"
+    return "none"
+
+
+def compress_chunks(chunks: Iterable[bytes], codec: str = "none") -> Iterator[bytes]:
+    """
+    Re-chunks NDJSON lines into ~64KB frames, compressing them on the fly.
+    Only one frame is held in memory at a time.
+    """
+    check_codec(codec)
+    if codec == "gzip":
+        compressor = zlib.compressobj(wbits=31)  # gzip container
+    elif codec == "zstd":
+        compressor = _zstd().ZstdCompressor().compressobj()
+    else:
+        compressor = None
+
+    buf = bytearray()
+    for chunk in chunks:
+        buf += chunk
+        if len(buf) >= _CHUNK_SIZE:
+            out = compressor.compress(bytes(buf)) if compressor else bytes(buf)
+            buf.clear()
+            if out:
+                yield out
+
+    if compressor:
+        tail = compressor.compress(bytes(buf)) + compressor.flush()
+        if tail:
+            yield tail
+    elif buf:
+        yield bytes(buf)
+
+
+def iter_lines(fileobj: IO[bytes], codec: str = "none") -> Iterator[bytes]:
+    check_codec(codec)
+    if codec == "gzip":
+        import gzip
+
+        stream: IO[bytes] = gzip.GzipFile(fileobj=fileobj, mode="rb")
+    elif codec == "zstd":
+        stream = io.BufferedReader(_zstd().ZstdDecompressor().stream_reader(fileobj))
+    else:
+        stream = fileobj
+
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield line
@@ -0,0 +1,227 @@
+"""
+Incrementally maintained telemetry aggregates.
+
+refresh_aggregates() folds raw rows created since each source's watermark
+into hourly TelemetryAggregate rows (count, errors, latency sum + sketch).
+Reads (query_aggregates) only touch the aggregate table, so dashboards never
+scan trace_steps / tool_calls / llm_calls.
+"""
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+
+from app.analytics.sketch import LatencySketch
+from app.db.models import AnalyticsWatermark, LLMCall, TelemetryAggregate, ToolCall, TraceStep
+
+SOURCE_OF_KIND = {"tool": "tool_calls", "step": "trace_steps", "llm": "llm_calls"}
+
+# Rows newer than now - SETTLE are left for the next refresh, so transactions
+# that commit slightly out of created_at order are not skipped.
+SETTLE = timedelta(seconds=30)
+# An agent_error is charged to the previous step of the same conversation; look
+# back this far before the watermark to find it.
+STEP_LOOKBACK = timedelta(hours=1)
+# First refresh on an existing database starts this far back.
+INITIAL_BACKFILL = timedelta(days=7)
+
+
+def hour_bucket(ts: datetime) -> datetime:
+    return ts.replace(minute=0, second=0, microsecond=0)
+
+
+@dataclass
+class _Acc:
+    count: int = 0
+    error_count: int = 0
+    latency_count: int = 0
+    latency_sum_ms: float = 0.0
+    sketch: LatencySketch = field(default_factory=LatencySketch)
+
+    def add(self, latency_ms: float | None, error: bool = False) -> None:
+        self.count += 1
+        self.error_count += int(error)
+        if latency_ms is not None:
+            self.latency_count += 1
+            self.latency_sum_ms += latency_ms
+            self.sketch.add(latency_ms)
+
+
+Key = tuple[str, str, datetime]  # (kind, name, bucket_start)
+
+
+def _fold_tool_calls(db: Session, start: datetime, end: datetime, acc: dict[Key, _Acc]) -> None:
+    stmt = (
+        select(ToolCall.tool_name, ToolCall.status, ToolCall.latency_ms, ToolCall.created_at)
+        .where(ToolCall.created_at > start, ToolCall.created_at <= end)
+        .execution_options(yield_per=1000)
+    )
+    for r in db.execute(stmt):
+        key = ("tool", r.tool_name, hour_bucket(r.created_at))
+        acc.setdefault(key, _Acc()).add(r.latency_ms, error=r.status != "ok")
+
+
+def _fold_llm_calls(db: Session, start: datetime, end: datetime, acc: dict[Key, _Acc]) -> None:
+    stmt = (
+        select(LLMCall.node, LLMCall.latency_ms, LLMCall.created_at)
+        .where(LLMCall.created_at > start, LLMCall.created_at <= end)
+        .execution_options(yield_per=1000)
+    )
+    for r in db.execute(stmt):
+        acc.setdefault(("llm", r.node, hour_bucket(r.created_at)), _Acc()).add(r.latency_ms)
+
+
+def _fold_trace_steps(db: Session, start: datetime, end: datetime, acc: dict[Key, _Acc]) -> None:
+    """
+    Step latency is the latency_ms recorded where the step ran (null for
+    markers). An agent_error counts as an error of the step that preceded it
+    in the same run, in that step's own bucket.
+    """
+    stmt = (
+        select(TraceStep.conversation_id, TraceStep.step_type, TraceStep.latency_ms, TraceStep.created_at)
+        .where(TraceStep.created_at > start - STEP_LOOKBACK, TraceStep.created_at <= end)
+        .order_by(TraceStep.conversation_id, TraceStep.created_at)
+        .execution_options(yield_per=1000)
+    )
+    prev = None
+    for r in db.execute(stmt):
+        if r.created_at > start:
+            acc.setdefault(("step", r.step_type, hour_bucket(r.created_at)), _Acc()).add(r.latency_ms)
+            if r.step_type == "agent_error" and prev is not None and prev.conversation_id == r.conversation_id:
+                # The failed step may sit in an earlier hour, or before `start` (already
+                # folded); either way its bucket is the one that gets the error.
+                acc.setdefault(("step", prev.step_type, hour_bucket(prev.created_at)), _Acc()).error_count += 1
+        prev = r
+
+
+_SOURCES = {
+    "tool_calls": _fold_tool_calls,
+    "llm_calls": _fold_llm_calls,
+    "trace_steps": _fold_trace_steps,
+}
+
+
+def _upsert(db: Session, acc: dict[Key, _Acc]) -> None:
+    if not acc:
+        return
+    existing = {
+        (a.kind, a.name, a.bucket_start): a
+        for a in db.scalars(
+            select(TelemetryAggregate).where(
+                tuple_(TelemetryAggregate.kind, TelemetryAggregate.name, TelemetryAggregate.bucket_start).in_(
+                    list(acc.keys())
+                )
+            )
+        )
+    }
+    for key, a in acc.items():
+        row = existing.get(key)
+        if row is None:
+            kind, name, bucket = key
+            row = TelemetryAggregate(
+                kind=kind,
+                name=name,
+                bucket_start=bucket,
+                count=0,
+                error_count=0,
+                latency_count=0,
+                latency_sum_ms=0.0,
+            )
+            db.add(row)
+            sketch = a.sketch
+        else:
+            sketch = LatencySketch.from_dict(row.latency_sketch)
+            sketch.merge(a.sketch)
+        row.count += a.count
+        row.error_count += a.error_count
+        row.latency_count += a.latency_count
+        row.latency_sum_ms += a.latency_sum_ms
+        row.latency_sketch = sketch.to_dict()
+
+
+def refresh_aggregates(db: Session, now: datetime | None = None) -> dict[str, int]:
+    """
+    Folds every source's new rows into the hourly aggregates and advances its
+    watermark, in one transaction per source. Returns the number of aggregate
+    buckets touched per source.
+    """
+    upper = (now or datetime.utcnow()) - SETTLE
+    touched = {}
+    for source, fold in _SOURCES.items():
+        # Row lock serializes overlapping refreshes; a concurrent first run
+        # fails on the watermark's primary key instead of double counting.
+        wm = db.get(AnalyticsWatermark, source, with_for_update=True)
+        start = wm.processed_until if wm else upper - INITIAL_BACKFILL
+        if start >= upper:
+            touched[source] = 0
+            continue
+
+        acc: dict[Key, _Acc] = {}
+        fold(db, start, upper, acc)
+        _upsert(db, acc)
+        if wm is None:
+            db.add(AnalyticsWatermark(source=source, processed_until=upper))
+        else:
+            wm.processed_until = upper
+        db.commit()
+        touched[source] = len(acc)
+    return touched
+
+
+def get_fresh_until(db: Session, source: str) -> datetime | None:
+    return db.scalar(select(AnalyticsWatermark.processed_until).where(AnalyticsWatermark.source == source))
+
+
+def query_aggregates(
+    db: Session,
+    kind: str,
+    since: datetime,
+    until: datetime,
+    by_hour: bool = False,
+) -> list[dict]:
+    """
+    Merges hourly aggregates of `kind` over [since, until) per name (and per
+    hour when by_hour). Results are ordered by p95 latency, slowest first.
+    """
+    stmt = select(
+        TelemetryAggregate.name,
+        TelemetryAggregate.bucket_start,
+        TelemetryAggregate.count,
+        TelemetryAggregate.error_count,
+        TelemetryAggregate.latency_count,
+        TelemetryAggregate.latency_sum_ms,
+        TelemetryAggregate.latency_sketch,
+    ).where(
+        TelemetryAggregate.kind == kind,
+        TelemetryAggregate.bucket_start >= hour_bucket(since),
+        TelemetryAggregate.bucket_start < until,
+    )
+
+    merged: dict[tuple, _Acc] = {}
+    for r in db.execute(stmt):
+        key = (r.name, r.bucket_start if by_hour else None)
+        a = merged.setdefault(key, _Acc())
+        a.count += r.count
+        a.error_count += r.error_count
+        a.latency_count += r.latency_count
+        a.latency_sum_ms += r.latency_sum_ms
+        a.sketch.merge(LatencySketch.from_dict(r.latency_sketch))
+
+    out = []
+    for (name, bucket), a in merged.items():
+        out.append(
+            {
+                "name": name,
+                "bucket_start": bucket,
+                "count": a.count,
+                "error_count": a.error_count,
+                "error_rate": a.error_count / a.count if a.count else 0.0,
+                "latency_mean_ms": a.latency_sum_ms / a.latency_count if a.latency_count else None,
+                "latency_p50_ms": a.sketch.quantile(0.50),
+                "latency_p95_ms": a.sketch.quantile(0.95),
+                "latency_p99_ms": a.sketch.quantile(0.99),
+            }
+        )
+    out.sort(key=lambda x: (x["bucket_start"] or datetime.min, -(x["latency_p95_ms"] or 0.0)))
+    return out
@@ -0,0 +1,119 @@
+from datetime import datetime
+from typing import Iterable, Iterator
+
+from sqlalchemy import DateTime, LargeBinary, Table, and_, or_, select, union
+from sqlalchemy.orm import Session
+
+from app.db.crud.utils import insert_ignoring_conflicts
+from app.db.models import Conversation, LLMCall, Message, RunSummary, ToolCall, ToolPayloadBlob, TraceStep
+
+# Parents first, so an export can be imported back without FK violations.
+EXPORT_MODELS = [Conversation, Message, TraceStep, ToolPayloadBlob, ToolCall, LLMCall, RunSummary]
+TABLES: dict[str, Table] = {m.__tablename__: m.__table__ for m in EXPORT_MODELS}
+
+DEFAULT_YIELD_PER = 1000
+DEFAULT_BATCH_SIZE = 1000
+
+
+def _window(column, since: datetime | None, until: datetime | None) -> list:
+    clauses = []
+    if since is not None:
+        clauses.append(column >= since)
+    if until is not None:
+        clauses.append(column < until)
+    return clauses
+
+
+def iter_export_records(
+    db: Session,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    yield_per: int = DEFAULT_YIELD_PER,
+) -> Iterator[dict]:
+    """
+    Yields {"table": ..., "row": {...}} records for every row created in [since, until).
+
+    Rows are fetched with a server-side cursor (yield_per), so memory stays flat
+    regardless of the size of the window. Conversations and payload blobs referenced
+    by any exported row are included even if they were created before `since`.
+    """
+    filters = {m: _window(m.created_at, since, until) for m in EXPORT_MODELS}
+    if since is not None or until is not None:
+        children = union(
+            *[
+                select(m.conversation_id).where(*filters[m])
+                for m in (Message, TraceStep, ToolCall, LLMCall, RunSummary)
+            ]
+        )
+        filters[Conversation] = [or_(and_(*filters[Conversation]), Conversation.id.in_(children))]
+
+        # Blobs are deduplicated, so they may predate the tool calls that use them.
+        blob_refs = union(
+            select(ToolCall.input_blob_hash).where(*filters[ToolCall]),
+            select(ToolCall.output_blob_hash).where(*filters[ToolCall]),
+        )
+        filters[ToolPayloadBlob] = [ToolPayloadBlob.hash.in_(blob_refs)]
+
+    for model in EXPORT_MODELS:
+        table = model.__table__
+        where = filters[model]
+        stmt = (
+            select(*table.c)
+            .where(*where)
+            .order_by(model.created_at.asc())
+            .execution_options(yield_per=yield_per)
+        )
+        for row in db.execute(stmt):
+            yield {"table": table.name, "row": row._asdict()}
+
+
+def _coerce_row(table: Table, row: dict) -> dict:
+    out = {}
+    for key, value in row.items():
+        col = table.c.get(key)
+        if col is None:
+            continue
+        if isinstance(value, str) and isinstance(col.type, DateTime):
+            value = datetime.fromisoformat(value)
+        elif isinstance(value, str) and isinstance(col.type, LargeBinary):
+            value = bytes.fromhex(value)
+        out[key] = value
+    return out
+
+
+def import_records(
+    db: Session,
+    records: Iterable[dict],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> dict[str, int]:
+    """
+    Inserts exported records with multi-row INSERT ... VALUES statements.
+
+    Records are buffered per table up to `batch_size` and committed per batch.
+    Rows whose primary key already exists are skipped, so re-importing is safe.
+    Returns the number of rows actually inserted per table.
+    """
+    counts = {name: 0 for name in TABLES}
+    current: str | None = None
+    batch: list[dict] = []
+
+    def flush() -> None:
+        if not batch:
+            return
+        result = db.execute(insert_ignoring_conflicts(db, TABLES[current]).values(batch))
+        db.commit()
+        # One multi-row statement, so rowcount excludes the rows skipped as duplicates.
+        counts[current] += result.rowcount if result.rowcount >= 0 else len(batch)
+        batch.clear()
+
+    for record in records:
+        name = record.get("table")
+        if name not in TABLES:
+            raise ValueError(f"Unknown table in import: {name!r}")
+        if name != current or len(batch) >= batch_size:
+            flush()
+            current = name
+        batch.append(_coerce_row(TABLES[name], record["row"]))
+
+    flush()
+    return counts
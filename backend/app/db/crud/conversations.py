@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import Row, select
 
 from app.db.models import Conversation, Message
 
@@ -32,10 +32,14 @@ def add_message(
     return msg
 
 
-def list_messages(db: Session, conversation_id: str) -> list[Message]:
+def list_messages(db: Session, conversation_id: str) -> list[Row]:
+    """
+    Column-only select: returns lightweight Rows (attribute access like the
+    model) without ORM identity-map bookkeeping. Validate them with MessageOut.
+    """
     stmt = (
-        select(Message)
+        select(*Message.__table__.c)
         .where(Message.conversation_id == conversation_id)
         .order_by(Message.created_at.asc())
     )
-    return list(db.scalars(stmt).all())
+    return list(db.execute(stmt).all())
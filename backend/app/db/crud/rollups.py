@@ -0,0 +1,113 @@
+from collections import Counter
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.db.crud.utils import insert_updating_conflicts
+from app.db.models import AnalyticsWatermark, RunSummary, TraceStep
+
+_END_STATUS = {"agent_end": "done", "agent_error": "error"}
+# How far past a window's end a run that started inside it is followed.
+RUN_MAX_DURATION = timedelta(hours=1)
+ROLLUP_WATERMARK = "run_summaries"
+
+
+def _summary(conversation_id: str, steps: list[tuple[str, str, datetime]]) -> dict:
+    counts = Counter(step_type for step_type, _, _ in steps)
+    last_type, last_content, _ = steps[-1]
+    return {
+        "conversation_id": conversation_id,
+        "status": _END_STATUS.get(last_type, "incomplete"),
+        "started_at": steps[0][2],
+        "ended_at": steps[-1][2],
+        "step_count": len(steps),
+        "tool_call_count": counts.get("tool_call", 0),
+        "step_type_counts": dict(counts),
+        "error": last_content[:500] if last_type == "agent_error" else None,
+    }
+
+
+def rollup_runs(
+    db: Session,
+    start: datetime,
+    end: datetime,
+    batch_size: int = 500,
+) -> int:
+    """
+    Compacts every run that started in [start, end) into one RunSummary.
+
+    A run is the steps from an `agent_start` up to the conversation's next
+    agent_start. Steps before a conversation's first agent_start in the window
+    are the tail of a run that started earlier (and belongs to the previous
+    window), so they are skipped. A run started before `end` is followed past
+    it for up to RUN_MAX_DURATION, so back-to-back windows neither split nor
+    truncate runs at their edges; a run still open after that is summarized as
+    incomplete. Steps are streamed in (conversation, time) order, so memory is
+    bounded by the longest single run. Summaries are upserted by (conversation,
+    start), so re-running a window is safe. Returns the number of runs summarized.
+    """
+    stmt = (
+        select(TraceStep.conversation_id, TraceStep.step_type, TraceStep.content, TraceStep.created_at)
+        .where(TraceStep.created_at >= start, TraceStep.created_at < end + RUN_MAX_DURATION)
+        .order_by(TraceStep.conversation_id, TraceStep.created_at)
+        .execution_options(yield_per=1000)
+    )
+
+    pending: list[dict] = []
+    total = 0
+    conv_id: str | None = None
+    collecting = False
+    run: list[tuple[str, str, datetime]] = []
+
+    def close_run() -> None:
+        nonlocal total
+        if run:
+            pending.append(_summary(conv_id, run))
+            total += 1
+            run.clear()
+        if len(pending) >= batch_size:
+            flush()
+
+    def flush() -> None:
+        if pending:
+            stmt = insert_updating_conflicts(db, RunSummary.__table__, ["conversation_id", "started_at"])
+            db.execute(stmt.values(pending))
+            pending.clear()
+
+    for row in db.execute(stmt):
+        if row.conversation_id != conv_id:
+            close_run()
+            conv_id = row.conversation_id
+            collecting = False
+        if row.step_type == "agent_start":
+            close_run()
+            # Runs starting at or after `end` belong to the next window.
+            collecting = row.created_at < end
+        if collecting:
+            run.append((row.step_type, row.content, row.created_at))
+
+    close_run()
+    flush()
+    db.commit()
+    return total
+
+
+def rollup_pending_runs(db: Session, cutoff: datetime) -> int:
+    """
+    Summarizes every run started before `cutoff` that has not been rolled up yet,
+    tracked by a watermark. The first call backfills all retained trace steps.
+    """
+    watermark = db.get(AnalyticsWatermark, ROLLUP_WATERMARK, with_for_update=True)
+    start = watermark.processed_until if watermark else db.scalar(select(func.min(TraceStep.created_at)))
+    if start is None or start >= cutoff:
+        db.commit()
+        return 0
+
+    total = rollup_runs(db, start, cutoff)
+    if watermark is None:
+        db.add(AnalyticsWatermark(source=ROLLUP_WATERMARK, processed_until=cutoff))
+    else:
+        watermark.processed_until = cutoff
+    db.commit()
+    return total
@@ -1,5 +1,8 @@
 from sqlalchemy.orm import Session
-from app.db.models import ToolCall, TraceStep
+
+from app.core.config import settings
+from app.db.models import LLMCall, ToolCall, TraceStep
+from app.db.payloads import encode_payload, store_blobs
 
 
 def log_trace_step(
@@ -7,11 +10,13 @@ def log_trace_step(
     conversation_id: str,
     step_type: str,
     content: str,
+    latency_ms: float | None = None,
 ) -> TraceStep:
     step = TraceStep(
         conversation_id=conversation_id,
         step_type=step_type,
         content=content,
+        latency_ms=latency_ms,
     )
     db.add(step)
     db.commit()
@@ -25,14 +30,35 @@ def log_tool_call(
     tool_name: str,
     input_payload: dict | None = None,
     output_payload: dict | None = None,
+    status: str = "ok",
+    latency_ms: float | None = None,
 ) -> ToolCall:
+    limit = settings.TOOL_PAYLOAD_INLINE_MAX_BYTES
+    enc_in = encode_payload(input_payload, limit)
+    enc_out = encode_payload(output_payload, limit)
+    store_blobs(db, [enc_in, enc_out])
+
     call = ToolCall(
         conversation_id=conversation_id,
         tool_name=tool_name,
-        input_payload=input_payload,
-        output_payload=output_payload,
+        input_payload=enc_in.inline,
+        output_payload=enc_out.inline,
+        input_blob_hash=enc_in.blob_hash,
+        output_blob_hash=enc_out.blob_hash,
+        input_size=enc_in.size,
+        output_size=enc_out.size,
+        status=status,
+        latency_ms=latency_ms,
     )
     db.add(call)
     db.commit()
     db.refresh(call)
     return call
+
+
+def log_llm_calls(db: Session, conversation_id: str, calls: list[dict]) -> None:
+    """Persists the usage records produced by app.llm.client.usage_record."""
+    if not calls:
+        return
+    db.add_all([LLMCall(conversation_id=conversation_id, **call) for call in calls])
+    db.commit()
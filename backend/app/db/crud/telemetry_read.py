@@ -1,22 +1,81 @@
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.orm import Session
 
-from app.db.models import TraceStep, ToolCall
+from app.db.models import LLMCall, TraceStep, ToolCall
+from app.db.payloads import load_blobs
 
 
-def list_trace_steps(db: Session, conversation_id: str) -> list[TraceStep]:
+def list_trace_steps(db: Session, conversation_id: str) -> list[Row]:
     stmt = (
-        select(TraceStep)
+        select(*TraceStep.__table__.c)
         .where(TraceStep.conversation_id == conversation_id)
         .order_by(TraceStep.created_at.asc())
     )
-    return list(db.scalars(stmt).all())
+    return list(db.execute(stmt).all())
 
 
-def list_tool_calls(db: Session, conversation_id: str) -> list[ToolCall]:
+def _summary(size: int | None, blob_hash: str | None) -> dict | None:
+    if size is None:
+        return None
+    return {"size_bytes": size, "compressed": blob_hash is not None, "blob_hash": blob_hash}
+
+
+def list_tool_calls(db: Session, conversation_id: str, include_payloads: bool = False) -> list[dict]:
+    """
+    By default only payload summaries are returned and the payload columns are
+    never read. With include_payloads=True, inline payloads are returned as-is
+    and out-of-line blobs are fetched in one query and decompressed.
+    """
+    cols = [
+        ToolCall.id,
+        ToolCall.conversation_id,
+        ToolCall.tool_name,
+        ToolCall.input_size,
+        ToolCall.output_size,
+        ToolCall.input_blob_hash,
+        ToolCall.output_blob_hash,
+        ToolCall.status,
+        ToolCall.latency_ms,
+        ToolCall.created_at,
+    ]
+    if include_payloads:
+        cols += [ToolCall.input_payload, ToolCall.output_payload]
+
     stmt = (
-        select(ToolCall)
+        select(*cols)
         .where(ToolCall.conversation_id == conversation_id)
         .order_by(ToolCall.created_at.asc())
     )
-    return list(db.scalars(stmt).all())
+    rows = db.execute(stmt).all()
+
+    blobs = {}
+    if include_payloads:
+        hashes = {h for r in rows for h in (r.input_blob_hash, r.output_blob_hash) if h}
+        blobs = load_blobs(db, hashes)
+
+    out = []
+    for r in rows:
+        item = {
+            "id": r.id,
+            "conversation_id": r.conversation_id,
+            "tool_name": r.tool_name,
+            "input_summary": _summary(r.input_size, r.input_blob_hash),
+            "output_summary": _summary(r.output_size, r.output_blob_hash),
+            "status": r.status,
+            "latency_ms": r.latency_ms,
+            "created_at": r.created_at,
+        }
+        if include_payloads:
+            item["input_payload"] = blobs.get(r.input_blob_hash) if r.input_blob_hash else r.input_payload
+            item["output_payload"] = blobs.get(r.output_blob_hash) if r.output_blob_hash else r.output_payload
+        out.append(item)
+    return out
+
+
+def list_llm_calls(db: Session, conversation_id: str) -> list[Row]:
+    stmt = (
+        select(*LLMCall.__table__.c)
+        .where(LLMCall.conversation_id == conversation_id)
+        .order_by(LLMCall.created_at.asc())
+    )
+    return list(db.execute(stmt).all())
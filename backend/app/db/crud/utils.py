@@ -0,0 +1,38 @@
+from sqlalchemy import Table, insert
+from sqlalchemy.orm import Session
+
+
+def insert_ignoring_conflicts(db: Session, table: Table):
+    """INSERT that skips rows hitting a unique/PK conflict, where the dialect supports it."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+        return pg_insert(table).on_conflict_do_nothing()
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+        return sqlite_insert(table).on_conflict_do_nothing()
+    return insert(table)
+
+
+def insert_updating_conflicts(db: Session, table: Table, index_elements: list[str]):
+    """
+    INSERT that overwrites the existing row on a conflict over `index_elements`
+    (all other non-key columns take the new values), where the dialect supports it.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        return insert(table)
+
+    stmt = dialect_insert(table)
+    updates = {
+        c.name: stmt.excluded[c.name]
+        for c in table.columns
+        if not c.primary_key and c.name not in index_elements
+    }
+    return stmt.on_conflict_do_update(index_elements=index_elements, set_=updates)
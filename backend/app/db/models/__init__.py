@@ -1,6 +1,20 @@
 from app.db.models.conversation import Conversation
+from app.db.models.llm_call import LLMCall
 from app.db.models.message import Message
+from app.db.models.run_summary import RunSummary
+from app.db.models.telemetry_aggregate import AnalyticsWatermark, TelemetryAggregate
 from app.db.models.tool_call import ToolCall
+from app.db.models.tool_payload_blob import ToolPayloadBlob
 from app.db.models.trace_step import TraceStep
 
-__all__ = ["Conversation", "Message", "ToolCall", "TraceStep"]
+__all__ = [
+    "AnalyticsWatermark",
+    "Conversation",
+    "LLMCall",
+    "Message",
+    "RunSummary",
+    "TelemetryAggregate",
+    "ToolCall",
+    "ToolPayloadBlob",
+    "TraceStep",
+]
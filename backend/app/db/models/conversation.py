@@ -14,7 +14,7 @@ class Conversation(Base):
         String, primary_key=True, default=lambda: str(uuid.uuid4())
     )
     title: Mapped[str | None] = mapped_column(String, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
 
     messages: Mapped[list["Message"]] = relationship(
         back_populates="conversation",
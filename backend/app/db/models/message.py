@@ -19,6 +19,6 @@ class Message(Base):
 
     role: Mapped[str] = mapped_column(String, nullable=False)  # user/assistant/system
     content: Mapped[str] = mapped_column(Text, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
 
     conversation: Mapped["Conversation"] = relationship(back_populates="messages")
@@ -0,0 +1,44 @@
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, Float, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class TelemetryAggregate(Base):
+    """
+    Hourly rollup of raw telemetry per (kind, name), maintained incrementally
+    by app.db.crud.analytics.refresh_aggregates.
+
+    kind: "tool" (tool_calls by tool_name), "step" (trace_steps by step_type)
+    or "llm" (llm_calls by node).
+    """
+
+    __tablename__ = "telemetry_aggregates"
+
+    kind: Mapped[str] = mapped_column(String, primary_key=True)
+    name: Mapped[str] = mapped_column(String, primary_key=True)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    error_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    latency_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    latency_sum_ms: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    latency_sketch: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+
+class AnalyticsWatermark(Base):
+    """
+    Per-source high-water mark (created_at) up to which aggregates are complete.
+    Also used by run rollups (source "run_summaries").
+    """
+
+    __tablename__ = "analytics_watermarks"
+
+    source: Mapped[str] = mapped_column(String, primary_key=True)
+    processed_until: Mapped[datetime] = mapped_column(DateTime, nullable=False)
@@ -1,14 +1,26 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import JSON, DateTime, ForeignKey, String
+from sqlalchemy import JSON, DateTime, Float, ForeignKey, Index, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
 
+PayloadJSON = JSON().with_variant(JSONB(), "postgresql")
+
 
 class ToolCall(Base):
     __tablename__ = "tool_calls"
+    # Partitioned by day on Postgres, see TraceStep.
+    __table_args__ = (
+        Index("ix_tool_calls_conversation_created", "conversation_id", "created_at"),
+        Index("ix_tool_calls_created_at", "created_at"),  # time-windowed export / rollups
+        # Blob reference lookups: orphan cleanup and the FK check on blob delete.
+        Index("ix_tool_calls_input_blob_hash", "input_blob_hash"),
+        Index("ix_tool_calls_output_blob_hash", "output_blob_hash"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id: Mapped[str] = mapped_column(
         String, primary_key=True, default=lambda: str(uuid.uuid4())
@@ -19,7 +31,22 @@ class ToolCall(Base):
 
     tool_name: Mapped[str] = mapped_column(String, nullable=False)
 
-    input_payload: Mapped[dict | None] = mapped_column(JSON, nullable=True)
-    output_payload: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    # Small payloads live inline; larger ones are NULL here and stored
+    # compressed in tool_payload_blobs under *_blob_hash.
+    input_payload: Mapped[dict | None] = mapped_column(PayloadJSON, nullable=True)
+    output_payload: Mapped[dict | None] = mapped_column(PayloadJSON, nullable=True)
+    input_blob_hash: Mapped[str | None] = mapped_column(
+        ForeignKey("tool_payload_blobs.hash"), nullable=True
+    )
+    output_blob_hash: Mapped[str | None] = mapped_column(
+        ForeignKey("tool_payload_blobs.hash"), nullable=True
+    )
+    input_size: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    output_size: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    status: Mapped[str] = mapped_column(String, nullable=False, default="ok")  # ok/error
+    latency_ms: Mapped[float | None] = mapped_column(Float, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, primary_key=True, default=datetime.utcnow
+    )
@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, LargeBinary, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class ToolPayloadBlob(Base):
+    """
+    Compressed tool payloads above TOOL_PAYLOAD_INLINE_MAX_BYTES, keyed by the
+    sha256 of their canonical JSON so identical outputs are stored once.
+    """
+
+    __tablename__ = "tool_payload_blobs"
+
+    hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    codec: Mapped[str] = mapped_column(String, nullable=False)  # zlib
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    compressed_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
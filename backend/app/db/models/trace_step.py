@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import DateTime, Float, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -9,6 +9,13 @@ from app.db.base import Base
 
 class TraceStep(Base):
     __tablename__ = "trace_steps"
+    # Partitioned by day on Postgres; created_at is part of the PK because
+    # every unique constraint on a partitioned table must include the partition key.
+    __table_args__ = (
+        Index("ix_trace_steps_conversation_created", "conversation_id", "created_at"),
+        Index("ix_trace_steps_created_at", "created_at"),  # time-windowed export / rollups
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id: Mapped[str] = mapped_column(
         String, primary_key=True, default=lambda: str(uuid.uuid4())
@@ -19,5 +26,9 @@ class TraceStep(Base):
 
     step_type: Mapped[str] = mapped_column(String, nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
+    # Measured where the step ran; null for markers (agent_start, node, ...)
+    latency_ms: Mapped[float | None] = mapped_column(Float, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, primary_key=True, default=datetime.utcnow
+    )
@@ -0,0 +1,87 @@
+"""
+Daily range partitions for the telemetry tables (Postgres only).
+
+Each table has one partition per day named `<table>_pYYYYMMDD` plus a
+`<table>_default` catch-all. Retention drops whole partitions instead of
+running DELETEs, so old telemetry goes away without bloat or vacuum work.
+On other dialects (SQLite in local runs) these helpers are no-ops.
+"""
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+PARTITIONED_TABLES = ("trace_steps", "tool_calls", "llm_calls")
+
+
+def _is_postgres(db: Session) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def partition_name(table: str, day: date) -> str:
+    return f"{table}_p{day:%Y%m%d}"
+
+
+def ensure_partitions(db: Session, start: date, days: int) -> list[str]:
+    """
+    Creates the default partition and daily partitions for [start, start + days).
+    Call ahead of time: Postgres refuses to create a day's partition once the
+    default partition already holds rows for that day.
+    """
+    if not _is_postgres(db):
+        return []
+
+    created = []
+    for table in PARTITIONED_TABLES:
+        db.execute(text(f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT"))
+        for offset in range(days):
+            day = start + timedelta(days=offset)
+            name = partition_name(table, day)
+            db.execute(
+                text(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+                    f"FOR VALUES FROM ('{day.isoformat()}') TO ('{(day + timedelta(days=1)).isoformat()}')"
+                )
+            )
+            created.append(name)
+    db.commit()
+    return created
+
+
+def list_partitions(db: Session, table: str) -> dict[str, date]:
+    """Returns {partition_name: day} for the daily partitions of `table`."""
+    rows = db.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :table"
+        ),
+        {"table": table},
+    ).scalars()
+
+    prefix = f"{table}_p"
+    out = {}
+    for name in rows:
+        if name.startswith(prefix):
+            try:
+                out[name] = datetime.strptime(name[len(prefix):], "%Y%m%d").date()
+            except ValueError:
+                continue
+    return out
+
+
+def drop_expired_partitions(db: Session, retention_days: int, today: date | None = None) -> list[str]:
+    """Drops daily partitions whose whole day is older than `retention_days`."""
+    if not _is_postgres(db):
+        return []
+
+    cutoff = (today or datetime.utcnow().date()) - timedelta(days=retention_days)
+    dropped = []
+    for table in PARTITIONED_TABLES:
+        for name, day in sorted(list_partitions(db, table).items(), key=lambda kv: kv[1]):
+            if day < cutoff:
+                db.execute(text(f"DROP TABLE IF EXISTS {name}"))
+                dropped.append(name)
+    db.commit()
+    return dropped
@@ -0,0 +1,104 @@
+"""
+Encoding of tool call payloads: inline JSON when small, otherwise a
+zlib-compressed blob addressed by the sha256 of its canonical JSON.
+"""
+import hashlib
+import json
+import zlib
+from dataclasses import dataclass
+
+from sqlalchemy import and_, delete, select
+from sqlalchemy.orm import Session
+
+from app.db.crud.utils import insert_ignoring_conflicts
+from app.db.models import ToolCall, ToolPayloadBlob
+
+CODEC = "zlib"
+
+
+@dataclass
+class EncodedPayload:
+    inline: dict | None
+    size: int | None
+    blob_hash: str | None = None
+    blob: dict | None = None  # row values for tool_payload_blobs
+
+
+def _canonical(payload: dict) -> bytes:
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode()
+
+
+def encode_payload(payload: dict | None, inline_max_bytes: int) -> EncodedPayload:
+    if payload is None:
+        return EncodedPayload(inline=None, size=None)
+
+    raw = _canonical(payload)
+    if len(raw) <= inline_max_bytes:
+        return EncodedPayload(inline=payload, size=len(raw))
+
+    digest = hashlib.sha256(raw).hexdigest()
+    data = zlib.compress(raw, 6)
+    return EncodedPayload(
+        inline=None,
+        size=len(raw),
+        blob_hash=digest,
+        blob={
+            "hash": digest,
+            "codec": CODEC,
+            "size_bytes": len(raw),
+            "compressed_size": len(data),
+            "data": data,
+        },
+    )
+
+
+def store_blobs(db: Session, encoded: list[EncodedPayload]) -> None:
+    """
+    Inserts the blobs of `encoded`, skipping hashes that are already stored (dedup).
+
+    Reused blobs may be orphans that delete_orphan_blobs is about to remove, so
+    every blob is pinned with FOR KEY SHARE until the caller commits the rows
+    referencing it (cleanup skips locked rows). A blob deleted before it could be
+    pinned is inserted again.
+    """
+    rows = {e.blob_hash: e.blob for e in encoded if e.blob is not None}
+    while rows:
+        db.execute(insert_ignoring_conflicts(db, ToolPayloadBlob.__table__).values(list(rows.values())))
+        pinned = db.scalars(
+            select(ToolPayloadBlob.hash)
+            .where(ToolPayloadBlob.hash.in_(rows))
+            .with_for_update(key_share=True)
+        )
+        for blob_hash in pinned:
+            rows.pop(blob_hash)
+
+
+def decode_blob(codec: str, data: bytes) -> dict:
+    if codec != CODEC:
+        raise ValueError(f"Unknown payload codec: {codec!r}")
+    return json.loads(zlib.decompress(data))
+
+
+def load_blobs(db: Session, hashes: set[str]) -> dict[str, dict]:
+    if not hashes:
+        return {}
+    stmt = select(ToolPayloadBlob.hash, ToolPayloadBlob.codec, ToolPayloadBlob.data).where(
+        ToolPayloadBlob.hash.in_(hashes)
+    )
+    return {row.hash: decode_blob(row.codec, row.data) for row in db.execute(stmt)}
+
+
+def delete_orphan_blobs(db: Session) -> int:
+    """
+    Removes blobs no tool call references any more (e.g. after partitions were
+    dropped). Blobs pinned by an in-flight store_blobs are skipped.
+    """
+    # One NOT EXISTS per column so each is an indexed anti-join.
+    unreferenced = and_(
+        ~select(ToolCall.id).where(ToolCall.input_blob_hash == ToolPayloadBlob.hash).exists(),
+        ~select(ToolCall.id).where(ToolCall.output_blob_hash == ToolPayloadBlob.hash).exists(),
+    )
+    orphans = select(ToolPayloadBlob.hash).where(unreferenced).with_for_update(skip_locked=True)
+    result = db.execute(delete(ToolPayloadBlob).where(ToolPayloadBlob.hash.in_(orphans)))
+    db.commit()
+    return result.rowcount
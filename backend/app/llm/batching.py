@@ -0,0 +1,71 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from app.llm.types import LLMError, LLMRequest, LLMResponse
+
+
+class MicroBatcher:
+    """
+    Coalesces requests arriving from concurrent threads into one provider call.
+
+    Requests that queue up while a batch is in flight go out together in the
+    next one. A request arriving within `max_wait_ms` of the previous one
+    (i.e. under concurrent load) also waits up to `max_wait_ms` for others to
+    join; a request on its own is sent at once, so it never pays for a batch
+    that cannot form. A batch is sent as soon as it reaches `max_batch`.
+    """
+
+    def __init__(self, send_batch, max_batch: int = 8, max_wait_ms: float = 10.0):
+        self._send_batch = send_batch
+        self.max_batch = max_batch
+        self.max_wait_s = max_wait_ms / 1000
+        self._last_arrival = float("-inf")
+        self._queue: queue.Queue[tuple[LLMRequest, Future, float]] = queue.Queue()
+        self._thread = threading.Thread(target=self._loop, name="llm-microbatcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, request: LLMRequest) -> LLMResponse:
+        future: Future = Future()
+        now = time.monotonic()
+        # Racy across threads, but only used as a load hint.
+        gap, self._last_arrival = now - self._last_arrival, now
+        self._queue.put((request, future, gap))
+        return future.result()
+
+    def _collect(self) -> list[tuple[LLMRequest, Future]]:
+        request, future, gap = self._queue.get()
+        batch = [(request, future)]
+        under_load = gap < self.max_wait_s
+        deadline = time.monotonic() + self.max_wait_s
+        while len(batch) < self.max_batch:
+            try:
+                request, future, _ = self._queue.get_nowait()
+            except queue.Empty:
+                # Everything queued is taken; only linger if others are likely to follow.
+                remaining = deadline - time.monotonic()
+                if not (under_load or len(batch) > 1) or remaining <= 0:
+                    break
+                try:
+                    request, future, _ = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            batch.append((request, future))
+        return batch
+
+    def _loop(self) -> None:
+        while True:
+            batch = self._collect()
+            try:
+                responses = self._send_batch([req for req, _ in batch])
+                if len(responses) != len(batch):
+                    # Responses can no longer be matched to requests; fail them all
+                    # rather than leave any caller blocked on its future.
+                    raise LLMError(f"Provider returned {len(responses)} responses for {len(batch)} requests")
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            for (_, future), response in zip(batch, responses):
+                future.set_result(response)
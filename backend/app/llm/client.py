@@ -0,0 +1,89 @@
+import time
+from functools import lru_cache
+
+from app.core.config import settings
+from app.llm.batching import MicroBatcher
+from app.llm.prompts import get_template
+from app.llm.retry import call_with_retries
+from app.llm.types import LLMRequest, LLMResponse
+
+
+class LLMClient:
+    """
+    Renders a prompt template, calls the provider with retries, and returns
+    the response together with a usage record for telemetry.
+
+    Calls marked batchable go through a MicroBatcher when the provider can
+    take several prompts per round-trip.
+    """
+
+    def __init__(self, provider, max_retries: int = 3, batch_max_size: int = 8, batch_max_wait_ms: float = 10.0):
+        self.provider = provider
+        self.max_retries = max_retries
+        self._batcher = None
+        if provider.supports_batching and batch_max_size > 1:
+            self._batcher = MicroBatcher(self._complete_batch, batch_max_size, batch_max_wait_ms)
+
+    def _complete_batch(self, requests: list[LLMRequest]) -> list[LLMResponse]:
+        return call_with_retries(lambda: self.provider.complete_batch(requests), self.max_retries)
+
+    def complete(self, template: str, batchable: bool = False, max_tokens: int = 512, **variables) -> LLMResponse:
+        request = LLMRequest(
+            messages=get_template(template).render(**variables),
+            template=template,
+            variables=variables,
+            max_tokens=max_tokens,
+        )
+        start = time.perf_counter()
+        if batchable and self._batcher is not None:
+            response = self._batcher.submit(request)
+        else:
+            response = call_with_retries(lambda: self.provider.complete(request), self.max_retries)
+        # Wall time as seen by the caller: includes retries and batch wait.
+        response.latency_ms = (time.perf_counter() - start) * 1000
+        return response
+
+
+def usage_record(node: str, response: LLMResponse) -> dict:
+    return {
+        "node": node,
+        "provider": response.provider,
+        "model": response.model,
+        "prompt_tokens": response.prompt_tokens,
+        "completion_tokens": response.completion_tokens,
+        "latency_ms": response.latency_ms,
+        "batch_size": response.batch_size,
+    }
+
+
+def build_provider():
+    provider = settings.LLM_PROVIDER
+    if provider == "auto":
+        provider = "openai" if settings.OPENAI_API_KEY else "fake"
+
+    if provider == "openai":
+        from app.llm.providers import OpenAIProvider
+
+        return OpenAIProvider(
+            api_key=settings.OPENAI_API_KEY,
+            model=settings.LLM_MODEL,
+            base_url=settings.LLM_BASE_URL,
+            timeout_s=settings.LLM_TIMEOUT_S,
+            max_connections=settings.LLM_MAX_CONNECTIONS,
+        )
+    if provider == "fake":
+        from app.llm.fake import FakeProvider
+
+        return FakeProvider()
+    raise ValueError(f"Unknown LLM_PROVIDER: {provider!r}")
+
+
+@lru_cache(maxsize=1)
+def get_llm_client() -> LLMClient:
+    """Process-wide client, so the HTTP connection pool is shared by all runs."""
+    return LLMClient(
+        build_provider(),
+        max_retries=settings.LLM_MAX_RETRIES,
+        batch_max_size=settings.LLM_BATCH_MAX_SIZE,
+        batch_max_wait_ms=settings.LLM_BATCH_MAX_WAIT_MS,
+    )
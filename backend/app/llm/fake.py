@@ -0,0 +1,87 @@
+"""
+Deterministic local provider, used when no API key is configured and in tests.
+
+Responses are produced per prompt template from the request variables; the
+defaults reproduce the agent's canned planner/supervisor output.
+"""
+import time
+from typing import Callable
+
+from app.llm.types import LLMRequest, LLMResponse
+
+Responder = Callable[[LLMRequest], str]
+
+
+def _planner(request: LLMRequest) -> str:
+    return (
+        "1) Identify the policy topic\n"
+        "2) Retrieve relevant policy sections\n"
+        "3) Summarize key rules in bullets\n"
+        "4) Highlight edge cases (carryover, eligibility, approvals)\n"
+    )
+
+
+def _supervisor(request: LLMRequest) -> str:
+    chunks = request.variables.get("chunk_list", [])
+    return (
+        "Here’s a structured summary of the leave policy (based on available policy excerpts):\n\n"
+        "Key rules:\n"
+        + "\n".join([f"- {c}" for c in chunks])
+        + "\n\n"
+        "If you tell me your location (state/country) and employee type, I can tailor the rules to your case."
+    )
+
+
+DEFAULT_RESPONDERS: dict[str, Responder] = {
+    "planner": _planner,
+    "planner_template": _planner,
+    "supervisor": _supervisor,
+}
+
+
+def _count_tokens(text: str) -> int:
+    return len(text.split())
+
+
+class FakeProvider:
+    name = "fake"
+    supports_batching = True
+
+    def __init__(
+        self,
+        responders: dict[str, Responder] | None = None,
+        latency_s: float = 0.0,
+        model: str = "fake-1",
+    ):
+        self.responders = {**DEFAULT_RESPONDERS, **(responders or {})}
+        self.latency_s = latency_s
+        self.model = model
+        self.calls = 0  # provider round-trips (a batch counts once)
+        self.requests: list[LLMRequest] = []
+
+    def _respond(self, request: LLMRequest, batch_size: int, started: float) -> LLMResponse:
+        responder = self.responders.get(request.template)
+        text = responder(request) if responder else request.messages[-1]["content"]
+        return LLMResponse(
+            text=text,
+            provider=self.name,
+            model=self.model,
+            prompt_tokens=sum(_count_tokens(m["content"]) for m in request.messages),
+            completion_tokens=_count_tokens(text),
+            latency_ms=(time.perf_counter() - started) * 1000,
+            batch_size=batch_size,
+        )
+
+    def complete(self, request: LLMRequest) -> LLMResponse:
+        return self.complete_batch([request])[0]
+
+    def complete_batch(self, requests: list[LLMRequest]) -> list[LLMResponse]:
+        started = time.perf_counter()
+        self.calls += 1
+        self.requests.extend(requests)
+        if self.latency_s:
+            time.sleep(self.latency_s)
+        return [self._respond(r, len(requests), started) for r in requests]
+
+    def close(self) -> None:
+        pass
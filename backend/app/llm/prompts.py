@@ -0,0 +1,62 @@
+"""
+Prompt templates for the agent nodes.
+
+Each template keeps its static instructions in the system message and puts
+request-specific text last, so every call shares an identical prefix that
+providers with prompt/prefix caching (e.g. OpenAI) can reuse. Templates are
+compiled once and cached.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from string import Template
+
+_TEMPLATES: dict[str, tuple[str, str]] = {
+    "planner": (
+        "You are the planning agent of an enterprise HR assistant. "
+        "Break the user's request into 3-5 short numbered steps. "
+        "Steps should cover: identifying the policy topic, retrieving the relevant "
+        "policy sections, summarizing the key rules, and highlighting edge cases "
+        "(carryover, eligibility, approvals). Reply with the numbered steps only.",
+        "User request:\n$user_message",
+    ),
+    # Plans cached per intent are generated from this prompt, which carries no
+    # user text, so a cached plan never leaks one user's request into another's.
+    "planner_template": (
+        "You are the planning agent of an enterprise HR assistant. "
+        "Write a reusable plan for every request in the given category: 3-5 short "
+        "numbered steps that do not depend on any particular request's details. "
+        "Steps should cover: identifying the policy topic, retrieving the relevant "
+        "policy sections, summarizing the key rules, and highlighting edge cases "
+        "(carryover, eligibility, approvals). Reply with the numbered steps only.",
+        "Available tools:\n$tools\n\nRequest category: $intent ($topic)",
+    ),
+    "supervisor": (
+        "You are the supervisor agent of an enterprise HR assistant. "
+        "Answer only from the policy excerpts provided. Summarize the key rules as "
+        "bullets, do not invent durations or numbers, and offer to tailor the answer "
+        "to the user's location and employee type.",
+        "Plan:\n$plan\n\nPolicy excerpts:\n$chunks\n\nUser request:\n$user_message",
+    ),
+}
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    name: str
+    system: str
+    user: Template
+
+    def render(self, **variables) -> list[dict[str, str]]:
+        return [
+            {"role": "system", "content": self.system},
+            {"role": "user", "content": self.user.substitute(variables)},
+        ]
+
+
+@lru_cache(maxsize=None)
+def get_template(name: str) -> PromptTemplate:
+    try:
+        system, user = _TEMPLATES[name]
+    except KeyError:
+        raise KeyError(f"Unknown prompt template: {name!r}") from None
+    return PromptTemplate(name=name, system=system, user=Template(user))
@@ -0,0 +1,98 @@
+import math
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from app.llm.types import LLMError, LLMRequest, LLMResponse, RetryableLLMError
+
+_RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header: delay-seconds (possibly fractional) or an HTTP-date."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        seconds = (when - datetime.now(timezone.utc)).total_seconds()
+    if not math.isfinite(seconds):
+        return None
+    return max(0.0, seconds)
+
+
+class OpenAIProvider:
+    """
+    OpenAI-compatible chat completions over one pooled, keep-alive HTTP client.
+    The chat endpoint takes one conversation per request, so no batching.
+    """
+
+    name = "openai"
+    supports_batching = False
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        base_url: str = "https://api.openai.com/v1",
+        timeout_s: float = 30.0,
+        max_connections: int = 20,
+    ):
+        import httpx
+
+        self.model = model
+        self._httpx = httpx
+        self._client = httpx.Client(
+            base_url=base_url,
+            headers={"Authorization": f"Bearer {api_key}"},
+            timeout=timeout_s,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=60.0,
+            ),
+        )
+
+    def complete(self, request: LLMRequest) -> LLMResponse:
+        body = {
+            "model": self.model,
+            "messages": request.messages,
+            "max_tokens": request.max_tokens,
+            "temperature": request.temperature,
+        }
+        start = time.perf_counter()
+        try:
+            resp = self._client.post("/chat/completions", json=body)
+        except (self._httpx.TimeoutException, self._httpx.TransportError) as e:
+            raise RetryableLLMError(f"{type(e).__name__}: {e}") from e
+
+        if resp.status_code in _RETRYABLE_STATUS:
+            raise RetryableLLMError(
+                f"HTTP {resp.status_code} from LLM provider",
+                retry_after=parse_retry_after(resp.headers.get("retry-after")),
+            )
+        if resp.status_code >= 400:
+            raise LLMError(f"HTTP {resp.status_code} from LLM provider: {resp.text[:200]}")
+
+        data = resp.json()
+        usage = data.get("usage") or {}
+        return LLMResponse(
+            text=data["choices"][0]["message"]["content"] or "",
+            provider=self.name,
+            model=data.get("model", self.model),
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            completion_tokens=usage.get("completion_tokens", 0),
+            latency_ms=(time.perf_counter() - start) * 1000,
+        )
+
+    def complete_batch(self, requests: list[LLMRequest]) -> list[LLMResponse]:
+        return [self.complete(r) for r in requests]
+
+    def close(self) -> None:
+        self._client.close()
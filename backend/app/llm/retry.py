@@ -0,0 +1,34 @@
+import random
+import time
+from typing import Callable, TypeVar
+
+from app.llm.types import RetryableLLMError
+
+T = TypeVar("T")
+
+
+def backoff_delay(attempt: int, base_s: float, max_s: float) -> float:
+    """Exponential backoff with full jitter: uniform(0, min(max, base * 2^attempt))."""
+    return random.uniform(0, min(max_s, base_s * (2 ** attempt)))
+
+
+def call_with_retries(
+    fn: Callable[[], T],
+    max_retries: int,
+    base_s: float = 0.25,
+    max_s: float = 8.0,
+    sleep: Callable[[float], None] | None = None,
+) -> T:
+    """Calls `fn`, retrying RetryableLLMError up to `max_retries` times."""
+    attempt = 0
+    while True:
+        try:
+            return fn()
+        except RetryableLLMError as e:
+            if attempt >= max_retries:
+                raise
+            delay = backoff_delay(attempt, base_s, max_s)
+            if e.retry_after is not None:
+                delay = max(delay, e.retry_after)
+            (sleep or time.sleep)(delay)
+            attempt += 1
@@ -0,0 +1,34 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+
+class LLMError(Exception):
+    pass
+
+
+class RetryableLLMError(LLMError):
+    """Transient failure (rate limit, 5xx, timeout); safe to retry."""
+
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass
+class LLMRequest:
+    messages: list[dict[str, str]]
+    template: str = ""  # name of the prompt template that produced `messages`
+    variables: dict[str, Any] = field(default_factory=dict)
+    max_tokens: int = 512
+    temperature: float = 0.0
+
+
+@dataclass
+class LLMResponse:
+    text: str
+    provider: str
+    model: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency_ms: float = 0.0
+    batch_size: int = 1
@@ -1,8 +1,40 @@
+from contextlib import asynccontextmanager
+from datetime import datetime
+
 from fastapi import FastAPI
 
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session
+
+from app.api.routes import router as api_router
+from app.core.config import settings
+from app.db.base import Base
+from app.db import models  # noqa: F401 - Import models to register them with Base
+from app.db.partitions import ensure_partitions
+from app.db.session import engine
+
+
+def init_db() -> None:
+    """Create tables and upcoming telemetry partitions, on the shared engine."""
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        ensure_partitions(db, datetime.utcnow().date(), settings.TELEMETRY_PARTITION_PREMAKE_DAYS)
+
 
-app = FastAPI(title="Enterprise AI Agent Orchestrator", version="0.1.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    init_db()
+    yield
+    engine.dispose()
+
+
+app = FastAPI(
+    title="Enterprise AI Agent Orchestrator",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -12,18 +44,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-from app.api.routes import router as api_router
-from app.core.config import settings
-from app.db.base import Base
-from app.db import models  # noqa: F401 - Import models to register them with Base
-
-# Create database tables on startup
-@app.on_event("startup")
-def startup_event():
-    from sqlalchemy import create_engine
-    engine = create_engine(settings.database_url)
-    Base.metadata.create_all(bind=engine)
-
 app.include_router(api_router, prefix="/api")
 
 @app.get("/health")
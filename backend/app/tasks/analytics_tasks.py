@@ -0,0 +1,13 @@
+from app.db.crud.analytics import refresh_aggregates
+from app.db.session import SessionLocal
+from app.tasks.celery_app import celery
+
+
+@celery.task(name="tasks.refresh_analytics", expires=60)
+def refresh_analytics() -> dict:
+    """Folds telemetry written since the last run into the hourly aggregates."""
+    db = SessionLocal()
+    try:
+        return refresh_aggregates(db)
+    finally:
+        db.close()
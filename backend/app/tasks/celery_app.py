@@ -1,10 +1,12 @@
 from celery import Celery
+from celery.schedules import crontab
 from app.core.config import settings
 
 celery = Celery(
     "agent_platform",
     broker=settings.CELERY_BROKER_URL,
     backend=settings.CELERY_RESULT_BACKEND,
+    include=["app.tasks.example_tasks", "app.tasks.telemetry_tasks", "app.tasks.analytics_tasks"],
 )
 
 celery.conf.update(
@@ -12,4 +14,14 @@ celery.conf.update(
     task_serializer="json",
     result_serializer="json",
     accept_content=["json"],
-)
\ No newline at end of file
+    beat_schedule={
+        "telemetry-maintenance": {
+            "task": "tasks.telemetry_maintenance",
+            "schedule": crontab(hour=3, minute=0),
+        },
+        "refresh-analytics": {
+            "task": "tasks.refresh_analytics",
+            "schedule": settings.ANALYTICS_REFRESH_INTERVAL_S,
+        },
+    },
+)
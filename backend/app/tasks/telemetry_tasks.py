@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta
+
+from app.core.config import settings
+from app.db.crud.rollups import rollup_pending_runs
+from app.db.partitions import drop_expired_partitions, ensure_partitions
+from app.db.payloads import delete_orphan_blobs
+from app.db.session import SessionLocal
+from app.tasks.celery_app import celery
+
+
+@celery.task(name="tasks.telemetry_maintenance")
+def telemetry_maintenance() -> dict:
+    """
+    Daily telemetry housekeeping:
+    1) pre-create the next days' partitions,
+    2) roll up runs older than TELEMETRY_ROLLUP_AFTER_DAYS not summarized yet
+       (everything still retained on the first run),
+    3) drop partitions older than TELEMETRY_RETENTION_DAYS,
+    4) delete tool payload blobs no longer referenced.
+    """
+    today = datetime.utcnow().date()
+    db = SessionLocal()
+    try:
+        created = ensure_partitions(db, today, settings.TELEMETRY_PARTITION_PREMAKE_DAYS)
+
+        # Watermarked: missed beats are caught up and each run is summarized once.
+        cutoff = datetime.combine(today - timedelta(days=settings.TELEMETRY_ROLLUP_AFTER_DAYS), datetime.min.time())
+        runs = rollup_pending_runs(db, cutoff)
+
+        dropped = drop_expired_partitions(db, settings.TELEMETRY_RETENTION_DAYS, today=today)
+        blobs = delete_orphan_blobs(db)
+    finally:
+        db.close()
+
+    return {
+        "partitions_created": len(created),
+        "runs_rolled_up": runs,
+        "partitions_dropped": dropped,
+        "blobs_deleted": blobs,
+    }
@@ -0,0 +1,11 @@
+"""Mock HR policy knowledge base; returns fixed chunks until a real index exists."""
+
+POLICY_CHUNKS = [
+    "Employees accrue 20 days PTO per year, with sick time up to 40 hours/year where applicable.",
+    "Baby bonding leave and maternity leave are available; specific durations vary by policy.",
+    "Requests should be submitted in advance; approvals depend on manager coverage needs.",
+]
+
+
+def mock_policy_kb_search(tool_input: dict) -> dict:
+    return {"top_chunks": list(POLICY_CHUNKS)}
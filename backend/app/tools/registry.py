@@ -0,0 +1,72 @@
+"""
+Registry of the tools agents can call.
+
+Agents resolve tools here by name at call time, so re-registering a tool
+changes what runs. Anything derived from the tool set (e.g. cached plans)
+keys on `tools_fingerprint()`, which changes whenever a tool is added,
+removed or re-registered with a new version.
+"""
+import hashlib
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from app.tools.policy_kb import mock_policy_kb_search
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    name: str
+    description: str
+    run: Callable[[dict[str, Any]], dict[str, Any]]
+    version: str = "1"
+
+
+_lock = threading.Lock()
+_tools: dict[str, ToolSpec] = {}
+_fingerprint: str | None = None
+
+
+def register_tool(spec: ToolSpec) -> None:
+    global _fingerprint
+    with _lock:
+        _tools[spec.name] = spec
+        _fingerprint = None
+
+
+def unregister_tool(name: str) -> None:
+    global _fingerprint
+    with _lock:
+        _tools.pop(name, None)
+        _fingerprint = None
+
+
+def get_tool(name: str) -> ToolSpec:
+    with _lock:
+        try:
+            return _tools[name]
+        except KeyError:
+            raise KeyError(f"Unknown tool: {name!r}") from None
+
+
+def list_tools() -> list[ToolSpec]:
+    with _lock:
+        return sorted(_tools.values(), key=lambda t: t.name)
+
+
+def tools_fingerprint() -> str:
+    global _fingerprint
+    with _lock:
+        if _fingerprint is None:
+            raw = "|".join(f"{t.name}:{t.version}" for t in sorted(_tools.values(), key=lambda t: t.name))
+            _fingerprint = hashlib.sha1(raw.encode()).hexdigest()[:12]
+        return _fingerprint
+
+
+register_tool(
+    ToolSpec(
+        name="mock_policy_kb_search",
+        description="Search the HR policy knowledge base and return the top matching chunks.",
+        run=mock_policy_kb_search,
+    )
+)
@@ -0,0 +1,41 @@
+"""
+Runs the microbenchmarks and saves their results.
+
+    cd backend && python -m benchmarks [--database-url postgresql+psycopg2://...] [--quick]
+    python -m benchmarks.loadgen --help      # ASGI load generator
+    python -m benchmarks.compare OLD.json NEW.json
+"""
+import argparse
+
+from benchmarks import bench_crud, bench_graph, bench_serialization
+from benchmarks.common import save_results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--database-url", default="sqlite://", help="database for the CRUD benchmarks")
+    parser.add_argument("--quick", action="store_true", help="fewer iterations, for smoke runs")
+    parser.add_argument("--out", help="results JSON path (default: benchmarks/results/...)")
+    args = parser.parse_args(argv)
+
+    scale = 10 if args.quick else 1
+    results = {
+        "graph": bench_graph.run(ops=200 // scale),
+        "crud": bench_crud.run(args.database_url, ops=500 // scale),
+        "serialization": bench_serialization.run(rows=10_000 // scale, repeat=3),
+    }
+
+    for group, entries in results.items():
+        print(group)
+        for name, value in entries.items():
+            if isinstance(value, dict):
+                print(f"  {name:<26} {value['us_per_op']:10.1f} us/op  {value['ops_per_s']:10.1f} ops/s")
+            else:
+                print(f"  {name:<26} {value * 1000:10.1f} ms")
+
+    path = save_results("micro", results, args.out)
+    print(f"saved {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Telemetry and conversation CRUD against SQLite (default) or any database URL."""
+from sqlalchemy.orm import Session
+
+from app.db.crud.conversations import add_message, create_conversation, list_messages
+from app.db.crud.telemetry import log_tool_call, log_trace_step
+from app.db.crud.telemetry_read import list_tool_calls, list_trace_steps
+from benchmarks.common import per_op, prepare_database
+
+_TOOL_OUTPUT = {"top_chunks": ["Employees accrue 20 days PTO per year. " * 8] * 5}
+
+
+def run(database_url: str = "sqlite://", ops: int = 500, repeat: int = 3) -> dict[str, dict]:
+    engine = prepare_database(database_url)
+    with Session(engine) as db:
+        conv_id = create_conversation(db, title="bench").id
+
+        def messages() -> None:
+            for i in range(ops):
+                add_message(db, conversation_id=conv_id, role="user", content=f"message {i}")
+
+        def trace_steps() -> None:
+            for i in range(ops):
+                log_trace_step(db, conv_id, "node", f"Entered node: {i}")
+
+        def tool_calls() -> None:
+            for i in range(ops):
+                log_tool_call(db, conv_id, "mock_policy_kb_search", {"query": str(i)}, _TOOL_OUTPUT)
+
+        results = {
+            "add_message": per_op(messages, ops, repeat),
+            "log_trace_step": per_op(trace_steps, ops, repeat),
+            "log_tool_call": per_op(tool_calls, ops, repeat),
+        }
+
+        results["list_messages"] = per_op(lambda: list_messages(db, conv_id), 1, repeat)
+        results["list_trace_steps"] = per_op(lambda: list_trace_steps(db, conv_id), 1, repeat)
+        results["list_tool_calls"] = per_op(lambda: list_tool_calls(db, conv_id), 1, repeat)
+        results["list_tool_calls_payloads"] = per_op(
+            lambda: list_tool_calls(db, conv_id, include_payloads=True), 1, repeat
+        )
+
+    engine.dispose()
+    return results
@@ -0,0 +1,24 @@
+"""LangGraph agent: full graph invoke, streamed run, and the tool node alone."""
+from app.agents import langgraph_agent as agent
+from benchmarks.common import per_op
+
+
+def run(ops: int = 200, repeat: int = 3) -> dict[str, dict]:
+    def invoke() -> None:
+        for i in range(ops):
+            agent.run_langgraph_agent("bench", f"How much PTO do I get? {i}")
+
+    def stream() -> None:
+        for i in range(ops):
+            for _ in agent.stream_langgraph_agent("bench", f"How much PTO do I get? {i}"):
+                pass
+
+    def tool_node() -> None:
+        for i in range(ops):
+            agent._tool_node(agent._init_state("bench", f"leave policy {i}"))
+
+    return {
+        "graph_invoke": per_op(invoke, ops, repeat),
+        "graph_stream": per_op(stream, ops, repeat),
+        "tool_node": per_op(tool_node, ops, repeat),
+    }
@@ -0,0 +1,107 @@
+"""
+History / telemetry / SSE serialization: the previous path (ORM objects,
+per-field FastAPI encoding, json.dumps) against the fast path (column-only
+rows, one TypeAdapter pass, pydantic-core / orjson bytes).
+
+    cd backend && python -m benchmarks.bench_serialization --rows 10000
+"""
+import argparse
+import json
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.api.schemas.history import ConversationHistory
+from app.api.serialization import dump_json
+from app.api.sse import sse_frame
+from app.db.crud.conversations import list_messages
+from app.db.models import Conversation, Message
+from benchmarks.common import best_of, sqlite_engine
+
+
+def _seed(db: Session, rows: int) -> str:
+    conv = Conversation(title="bench")
+    db.add(conv)
+    db.commit()
+    conv_id = conv.id
+    t0 = datetime.utcnow()
+    db.execute(
+        insert(Message),
+        [
+            {
+                "id": str(uuid.uuid4()),
+                "conversation_id": conv_id,
+                "role": "user" if i % 2 else "assistant",
+                "content": f"message {i} " + "lorem ipsum " * 20,
+                "created_at": t0 + timedelta(milliseconds=i),
+            }
+            for i in range(rows)
+        ],
+    )
+    db.commit()
+    return conv_id
+
+
+def run(rows: int, repeat: int) -> dict[str, float]:
+    engine = sqlite_engine()
+    with Session(engine) as db:
+        conv_id = _seed(db, rows)
+
+    def orm_path() -> bytes:
+        with Session(engine) as db:
+            c = db.get(Conversation, conv_id)
+            msgs = list(db.scalars(select(Message).where(Message.conversation_id == conv_id).order_by(Message.created_at)))
+            model = ConversationHistory.model_validate({"conversation": c, "messages": msgs}, from_attributes=True)
+            return json.dumps(jsonable_encoder(model)).encode()
+
+    def fast_path() -> bytes:
+        with Session(engine) as db:
+            c = db.get(Conversation, conv_id)
+            return dump_json(ConversationHistory, {"conversation": c, "messages": list_messages(db, conv_id)})
+
+    assert json.loads(orm_path()) == json.loads(fast_path())
+
+    words = [f"w{i}" for i in range(rows)]
+
+    def sse_json_dumps() -> None:
+        built = []
+        for w in words[:2000]:
+            built.append(w)
+            f"event: token\ndata: {json.dumps({'delta': w + ' ', 'partial': ' '.join(built)})}\n\n".encode()
+
+    def sse_orjson() -> None:
+        built = []
+        for w in words[:2000]:
+            built.append(w)
+            sse_frame("token", {"delta": w + " ", "partial": " ".join(built)})
+
+    return {
+        "history_orm_s": best_of(orm_path, repeat),
+        "history_fast_s": best_of(fast_path, repeat),
+        "sse_json_dumps_s": best_of(sse_json_dumps, repeat),
+        "sse_orjson_s": best_of(sse_orjson, repeat),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    res = run(args.rows, args.repeat)
+    print(f"history, {args.rows} messages")
+    print(f"  ORM + jsonable_encoder + json.dumps: {res['history_orm_s'] * 1000:8.1f} ms")
+    print(f"  rows + TypeAdapter.dump_json:        {res['history_fast_s'] * 1000:8.1f} ms")
+    print(f"  speedup: {res['history_orm_s'] / res['history_fast_s']:.1f}x")
+    print("SSE token frames, 2000 tokens")
+    print(f"  json.dumps: {res['sse_json_dumps_s'] * 1000:8.1f} ms")
+    print(f"  orjson:     {res['sse_orjson_s'] * 1000:8.1f} ms")
+    print(f"  speedup: {res['sse_json_dumps_s'] / res['sse_orjson_s']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
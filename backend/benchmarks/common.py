@@ -0,0 +1,116 @@
+import json
+import os
+import platform
+import subprocess
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def sqlite_engine() -> Engine:
+    """In-memory SQLite with the full schema, shared across threads."""
+    return prepare_database("sqlite://")
+
+
+def prepare_database(url: str) -> Engine:
+    """
+    Creates the schema (and today's partitions on Postgres) for `url` and binds
+    the app's SessionLocal to it, so routes and tasks use this database.
+    """
+    from app.db import models  # noqa: F401 - register models with Base
+    from app.db.base import Base
+    from app.db.partitions import ensure_partitions
+    from app.db.session import SessionLocal
+
+    if url == "sqlite://":
+        engine = create_engine(url, poolclass=StaticPool, connect_args={"check_same_thread": False})
+    elif url.startswith("sqlite"):
+        engine = create_engine(url, connect_args={"check_same_thread": False})
+    else:
+        engine = create_engine(url, pool_size=20, max_overflow=20)
+
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        ensure_partitions(db, datetime.utcnow().date(), 2)
+    SessionLocal.configure(bind=engine)
+    return engine
+
+
+def best_of(fn: Callable[[], object], repeat: int = 5) -> float:
+    """Best wall time in seconds over `repeat` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def per_op(fn: Callable[[], object], ops: int, repeat: int = 3) -> dict[str, float]:
+    """Runs `fn` (which performs `ops` operations) and reports per-operation cost."""
+    seconds = best_of(fn, repeat)
+    return {"ops": ops, "total_s": seconds, "us_per_op": seconds / ops * 1e6, "ops_per_s": ops / seconds}
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    """p50/p95/p99 (nearest-rank) plus mean/max, in the samples' unit."""
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+
+    def rank(p: float) -> float:
+        idx = max(0, min(len(ordered) - 1, int(round(p / 100 * len(ordered) + 0.5)) - 1))
+        return ordered[idx]
+
+    return {
+        "p50": rank(50),
+        "p95": rank(95),
+        "p99": rank(99),
+        "mean": sum(ordered) / len(ordered),
+        "max": ordered[-1],
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def save_results(name: str, results: dict, out: str | None = None) -> Path:
+    """
+    Writes results plus run metadata to JSON. Default location is
+    benchmarks/results/<name>-<commit>-<timestamp>.json.
+    """
+    commit = _git_commit()
+    stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+    path = Path(out) if out else RESULTS_DIR / f"{name}-{commit or 'nogit'}-{stamp}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    doc = {
+        "name": name,
+        "commit": commit,
+        "created_at": stamp,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "results": results,
+    }
+    path.write_text(json.dumps(doc, indent=2, sort_keys=True))
+    return path
@@ -0,0 +1,65 @@
+"""
+Compares two saved benchmark result files metric by metric.
+
+    python -m benchmarks.compare benchmarks/results/micro-abc123-....json benchmarks/results/micro-def456-....json
+
+For timings (us_per_op, *_s, latency/ttft percentiles) lower is better; for
+throughput (ops_per_s, throughput_rps) higher is better. Changes beyond
+--threshold percent are flagged.
+"""
+import argparse
+import json
+from pathlib import Path
+
+_HIGHER_IS_BETTER = ("ops_per_s", "throughput_rps")
+_SKIP = ("ops", "requests", "concurrency", "errors", "total_s", "elapsed_s")
+
+
+def _flatten(prefix: str, value, out: dict[str, float]) -> None:
+    if isinstance(value, dict):
+        for key, sub in value.items():
+            _flatten(f"{prefix}.{key}" if prefix else key, sub, out)
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        out[prefix] = float(value)
+
+
+def compare(old: dict, new: dict, threshold: float) -> list[tuple[str, float, float, float, str]]:
+    a: dict[str, float] = {}
+    b: dict[str, float] = {}
+    _flatten("", old["results"], a)
+    _flatten("", new["results"], b)
+
+    rows = []
+    for key in sorted(a.keys() & b.keys()):
+        if key.rsplit(".", 1)[-1] in _SKIP or key.endswith("scenario") or a[key] == 0:
+            continue
+        change = (b[key] - a[key]) / a[key] * 100
+        better = change > 0 if key.endswith(_HIGHER_IS_BETTER) else change < 0
+        flag = ""
+        if abs(change) >= threshold:
+            flag = "improved" if better else "REGRESSED"
+        rows.append((key, a[key], b[key], change, flag))
+    return rows
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.compare")
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=10.0, help="percent change to flag")
+    args = parser.parse_args(argv)
+
+    old = json.loads(Path(args.old).read_text())
+    new = json.loads(Path(args.new).read_text())
+    print(f"{old.get('commit')} -> {new.get('commit')}")
+
+    regressed = False
+    for key, before, after, change, flag in compare(old, new, args.threshold):
+        regressed |= flag == "REGRESSED"
+        print(f"  {key:<48} {before:12.3f} {after:12.3f} {change:+8.1f}%  {flag}")
+
+    raise SystemExit(1 if regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
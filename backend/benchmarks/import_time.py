@@ -0,0 +1,94 @@
+"""
+Cold-start report: imports a module in a fresh interpreter under
+`python -X importtime` and lists the most expensive imports.
+
+    cd backend && python -m benchmarks.import_time                # app.main (API boot)
+    python -m benchmarks.import_time --module app.tasks.celery_app  # worker boot
+    python -m benchmarks.import_time --first-request                # + building the graph
+
+Cumulative times include everything a module pulls in, so the top entries
+show which dependency to defer. Results are saved like the other benchmarks.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from benchmarks.common import save_results
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def _import_profile(module: str, extra: str = "") -> tuple[float, dict[str, int], float]:
+    """Returns (wall seconds, {module: cumulative us}, extra seconds) for one cold run."""
+    code = f"import time; import {module}; t = time.perf_counter(); {extra}; print(time.perf_counter() - t)"
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=BACKEND_DIR,
+        check=True,
+    )
+    wall = time.perf_counter() - start
+
+    cumulative: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # "import time:  self [us] | cumulative | imported package"
+        _, cum, name = line[len("import time:"):].split("|", 2)
+        name = name.strip()
+        cumulative[name] = max(cumulative.get(name, 0), int(cum))
+    return wall, cumulative, float(proc.stdout.strip().splitlines()[-1])
+
+
+def report(module: str, runs: int, top: int, first_request: bool) -> dict:
+    extra = "import app.agents.langgraph_agent as a; a.get_graph()" if first_request else "pass"
+    walls, extras, profiles = [], [], []
+    for _ in range(runs):
+        wall, cumulative, extra_s = _import_profile(module, extra)
+        walls.append(wall)
+        extras.append(extra_s)
+        profiles.append(cumulative)
+
+    names = set().union(*profiles)
+    median_us = {n: statistics.median(p.get(n, 0) for p in profiles) for n in names}
+    ranked = sorted(median_us.items(), key=lambda kv: kv[1], reverse=True)
+
+    result = {
+        "module": module,
+        "runs": runs,
+        "process_wall_ms": statistics.median(walls) * 1000,
+        "import_ms": median_us.get(module, 0) / 1000,
+        "top_imports_ms": {name: us / 1000 for name, us in ranked[:top]},
+    }
+    if first_request:
+        result["graph_build_ms"] = statistics.median(extras) * 1000
+    return result
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.import_time")
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--first-request", action="store_true", help="also time building the agent graph")
+    parser.add_argument("--out", help="results JSON path (default: benchmarks/results/...)")
+    args = parser.parse_args(argv)
+
+    result = report(args.module, args.runs, args.top, args.first_request)
+    print(f"{args.module}: import {result['import_ms']:.1f} ms, process {result['process_wall_ms']:.1f} ms (median of {args.runs})")
+    if "graph_build_ms" in result:
+        print(f"first graph build: {result['graph_build_ms']:.1f} ms")
+    for name, ms in result["top_imports_ms"].items():
+        print(f"  {ms:9.1f} ms  {name}")
+
+    path = save_results("import_time", result, args.out)
+    print(f"saved {path}")
+
+
+if __name__ == "__main__":
+    main()
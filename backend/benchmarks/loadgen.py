@@ -0,0 +1,185 @@
+"""
+In-process load generator: drives the FastAPI app directly over ASGI (no
+network, no server) with many concurrent clients.
+
+    cd backend && python -m benchmarks.loadgen --scenario stream --concurrency 50 --requests 200
+
+Scenarios:
+  run        POST /conversations/{id}/run
+  stream     POST /conversations/{id}/run/stream (SSE; also records time-to-first-token)
+  telemetry  GET  /conversations/{id}/telemetry
+
+Reports throughput, p50/p95/p99 latency (and TTFT for streams) in ms.
+"""
+import argparse
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+
+from benchmarks.common import percentiles, prepare_database, save_results
+
+SCENARIOS = ("run", "stream", "telemetry")
+
+
+@dataclass
+class Sample:
+    status: int
+    latency: float
+    ttft: float | None = None
+    body: bytes = b""
+
+
+@dataclass
+class Stats:
+    latencies: list[float] = field(default_factory=list)
+    ttfts: list[float] = field(default_factory=list)
+    errors: int = 0
+
+
+async def asgi_request(app, method: str, path: str, payload: dict | None = None, first_marker: bytes | None = None) -> Sample:
+    """
+    Minimal streaming ASGI client. Unlike buffering test clients it sees each
+    body chunk as the app sends it, so time-to-first-token is measurable.
+    """
+    body = json.dumps(payload).encode() if payload is not None else b""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench"), (b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        "client": ("127.0.0.1", 0),
+        "server": ("bench", 80),
+    }
+    sent = False
+    disconnect = asyncio.Event()
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    start = time.perf_counter()
+    status = 0
+    ttft = None
+    chunks: list[bytes] = []
+
+    async def send(message):
+        nonlocal status, ttft
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunk = message.get("body", b"")
+            if ttft is None and first_marker is not None and first_marker in chunk:
+                ttft = time.perf_counter() - start
+            chunks.append(chunk)
+
+    try:
+        await app(scope, receive, send)
+    finally:
+        disconnect.set()
+    return Sample(status=status, latency=time.perf_counter() - start, ttft=ttft, body=b"".join(chunks))
+
+
+async def _create_conversation(app) -> str:
+    res = await asgi_request(app, "POST", "/api/conversations", {"title": "loadgen"})
+    return json.loads(res.body)["id"]
+
+
+async def run_load(app, scenario: str, concurrency: int, requests: int) -> dict:
+    if scenario not in SCENARIOS:
+        raise ValueError(f"scenario must be one of {', '.join(SCENARIOS)}")
+
+    # One conversation per client, like real users; telemetry reads need some history first.
+    conv_ids = [await _create_conversation(app) for _ in range(concurrency)]
+    if scenario == "telemetry":
+        for cid in conv_ids:
+            await asgi_request(app, "POST", f"/api/conversations/{cid}/run", {"user_message": "warmup"})
+
+    stats = Stats()
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for i in range(requests):
+        queue.put_nowait(i)
+
+    async def client(cid: str) -> None:
+        while True:
+            try:
+                i = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            message = {"user_message": f"How many PTO days do I get? ({i})"}
+            if scenario == "run":
+                res = await asgi_request(app, "POST", f"/api/conversations/{cid}/run", message)
+            elif scenario == "stream":
+                res = await asgi_request(app, "POST", f"/api/conversations/{cid}/run/stream", message, b"event: token")
+            else:
+                res = await asgi_request(app, "GET", f"/api/conversations/{cid}/telemetry")
+
+            if res.status != 200 or b"event: error" in res.body:
+                stats.errors += 1
+            stats.latencies.append(res.latency)
+            if res.ttft is not None:
+                stats.ttfts.append(res.ttft)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(cid) for cid in conv_ids))
+    elapsed = time.perf_counter() - start
+
+    result = {
+        "scenario": scenario,
+        "concurrency": concurrency,
+        "requests": requests,
+        "errors": stats.errors,
+        "elapsed_s": elapsed,
+        "throughput_rps": requests / elapsed,
+        "latency_ms": {k: v * 1000 for k, v in percentiles(stats.latencies).items()},
+    }
+    if stats.ttfts:
+        result["ttft_ms"] = {k: v * 1000 for k, v in percentiles(stats.ttfts).items()}
+    return result
+
+
+def _print(result: dict) -> None:
+    print(
+        f"{result['scenario']}: {result['requests']} requests @ concurrency {result['concurrency']} "
+        f"in {result['elapsed_s']:.2f}s -> {result['throughput_rps']:.1f} req/s, {result['errors']} errors"
+    )
+    for key in ("latency_ms", "ttft_ms"):
+        if key in result:
+            p = result[key]
+            print(f"  {key:<10} p50 {p['p50']:8.1f}  p95 {p['p95']:8.1f}  p99 {p['p99']:8.1f}  max {p['max']:8.1f}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.loadgen")
+    parser.add_argument("--scenario", choices=SCENARIOS + ("all",), default="all")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--database-url", default="sqlite:////tmp/agent_loadgen.db")
+    parser.add_argument("--out", help="results JSON path (default: benchmarks/results/...)")
+    args = parser.parse_args(argv)
+
+    prepare_database(args.database_url)
+    from app.main import app
+
+    scenarios = SCENARIOS if args.scenario == "all" else (args.scenario,)
+    results = {}
+    for scenario in scenarios:
+        results[scenario] = asyncio.run(run_load(app, scenario, args.concurrency, args.requests))
+        _print(results[scenario])
+
+    path = save_results("loadgen", results, args.out)
+    print(f"saved {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""trace step latency
+
+Revision ID: 2c7d5a9e1f04
+Revises: 9e6f1c4b8a23
+Create Date: 2026-10-19 21:34:08.517260
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2c7d5a9e1f04'
+down_revision: Union[str, None] = '9e6f1c4b8a23'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('trace_steps') as batch_op:
+        batch_op.add_column(sa.Column('latency_ms', sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('trace_steps') as batch_op:
+        batch_op.drop_column('latency_ms')
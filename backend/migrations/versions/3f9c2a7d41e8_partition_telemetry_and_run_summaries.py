@@ -0,0 +1,109 @@
+"""partition telemetry tables by day, add run_summaries
+
+Revision ID: 3f9c2a7d41e8
+Revises: b515c302adb1
+Create Date: 2026-10-19 09:12:03.417730
+
+"""
+from datetime import date, timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c2a7d41e8'
+down_revision: Union[str, None] = 'b515c302adb1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PREMAKE_DAYS = 7
+
+_COLUMNS = {
+    'trace_steps': (
+        "id VARCHAR NOT NULL, "
+        "conversation_id VARCHAR NOT NULL REFERENCES conversations (id) ON DELETE CASCADE, "
+        "step_type VARCHAR NOT NULL, "
+        "content TEXT NOT NULL, "
+        "created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL"
+    ),
+    'tool_calls': (
+        "id VARCHAR NOT NULL, "
+        "conversation_id VARCHAR NOT NULL REFERENCES conversations (id) ON DELETE CASCADE, "
+        "tool_name VARCHAR NOT NULL, "
+        "input_payload JSON, "
+        "output_payload JSON, "
+        "created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL"
+    ),
+}
+
+
+def _partition_table(table: str) -> None:
+    bind = op.get_bind()
+    op.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+    op.execute(f"ALTER TABLE {table}_legacy RENAME CONSTRAINT {table}_pkey TO {table}_legacy_pkey")
+    op.execute(
+        f"CREATE TABLE {table} ({_COLUMNS[table]}, PRIMARY KEY (id, created_at)) "
+        "PARTITION BY RANGE (created_at)"
+    )
+    op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+    first = bind.execute(sa.text(f"SELECT min(created_at)::date FROM {table}_legacy")).scalar()
+    day = first or date.today()
+    last = date.today() + timedelta(days=PREMAKE_DAYS)
+    while day < last:
+        op.execute(
+            f"CREATE TABLE {table}_p{day:%Y%m%d} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{day.isoformat()}') TO ('{(day + timedelta(days=1)).isoformat()}')"
+        )
+        day += timedelta(days=1)
+
+    op.execute(f"INSERT INTO {table} SELECT * FROM {table}_legacy")
+    op.execute(f"DROP TABLE {table}_legacy")
+    op.create_index(f'ix_{table}_conversation_created', table, ['conversation_id', 'created_at'])
+
+
+def _unpartition_table(table: str) -> None:
+    op.execute(f"ALTER TABLE {table} RENAME TO {table}_partitioned")
+    op.execute(f"ALTER INDEX {table}_pkey RENAME TO {table}_partitioned_pkey")
+    op.execute(f"CREATE TABLE {table} ({_COLUMNS[table]}, PRIMARY KEY (id))")
+    op.execute(f"INSERT INTO {table} SELECT * FROM {table}_partitioned")
+    op.execute(f"DROP TABLE {table}_partitioned CASCADE")
+
+
+def upgrade() -> None:
+    op.create_table('run_summaries',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('conversation_id', sa.String(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=False),
+    sa.Column('ended_at', sa.DateTime(), nullable=False),
+    sa.Column('step_count', sa.Integer(), nullable=False),
+    sa.Column('tool_call_count', sa.Integer(), nullable=False),
+    sa.Column('step_type_counts', sa.JSON(), nullable=False),
+    sa.Column('error', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['conversation_id'], ['conversations.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('conversation_id', 'started_at')
+    )
+
+    if op.get_bind().dialect.name != 'postgresql':
+        for table in ('trace_steps', 'tool_calls'):
+            op.create_index(f'ix_{table}_conversation_created', table, ['conversation_id', 'created_at'])
+        return
+
+    for table in ('trace_steps', 'tool_calls'):
+        _partition_table(table)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        for table in ('tool_calls', 'trace_steps'):
+            _unpartition_table(table)
+    else:
+        for table in ('tool_calls', 'trace_steps'):
+            op.drop_index(f'ix_{table}_conversation_created', table_name=table)
+
+    op.drop_table('run_summaries')
@@ -0,0 +1,27 @@
+"""tool_calls blob hash indexes
+
+Revision ID: 5b8d3e2a9c17
+Revises: e4a1b7c9d2f3
+Create Date: 2026-10-19 18:41:05.117342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8d3e2a9c17'
+down_revision: Union[str, None] = 'e4a1b7c9d2f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_tool_calls_input_blob_hash', 'tool_calls', ['input_blob_hash'])
+    op.create_index('ix_tool_calls_output_blob_hash', 'tool_calls', ['output_blob_hash'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tool_calls_output_blob_hash', table_name='tool_calls')
+    op.drop_index('ix_tool_calls_input_blob_hash', table_name='tool_calls')
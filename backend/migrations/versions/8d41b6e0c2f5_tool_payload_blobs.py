@@ -0,0 +1,64 @@
+"""compressed out-of-line tool payloads
+
+Revision ID: 8d41b6e0c2f5
+Revises: 3f9c2a7d41e8
+Create Date: 2026-10-19 11:04:52.918204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d41b6e0c2f5'
+down_revision: Union[str, None] = '3f9c2a7d41e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('tool_payload_blobs',
+    sa.Column('hash', sa.String(length=64), nullable=False),
+    sa.Column('codec', sa.String(), nullable=False),
+    sa.Column('size_bytes', sa.Integer(), nullable=False),
+    sa.Column('compressed_size', sa.Integer(), nullable=False),
+    sa.Column('data', sa.LargeBinary(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('hash')
+    )
+    with op.batch_alter_table('tool_calls') as batch_op:
+        batch_op.add_column(sa.Column('input_blob_hash', sa.String(), nullable=True))
+        batch_op.add_column(sa.Column('output_blob_hash', sa.String(), nullable=True))
+        batch_op.add_column(sa.Column('input_size', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('output_size', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key('tool_calls_input_blob_hash_fkey', 'tool_payload_blobs', ['input_blob_hash'], ['hash'])
+        batch_op.create_foreign_key('tool_calls_output_blob_hash_fkey', 'tool_payload_blobs', ['output_blob_hash'], ['hash'])
+
+    if op.get_bind().dialect.name == 'postgresql':
+        for col in ('input_payload', 'output_payload'):
+            op.alter_column('tool_calls', col, type_=postgresql.JSONB(), postgresql_using=f'{col}::jsonb')
+
+    # Existing rows stay inline; record their sizes so summaries work for them too.
+    op.execute(
+        "UPDATE tool_calls SET "
+        "input_size = length(CAST(input_payload AS TEXT)), "
+        "output_size = length(CAST(output_payload AS TEXT))"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        for col in ('input_payload', 'output_payload'):
+            op.alter_column('tool_calls', col, type_=sa.JSON(), postgresql_using=f'{col}::json')
+
+    with op.batch_alter_table('tool_calls') as batch_op:
+        batch_op.drop_constraint('tool_calls_output_blob_hash_fkey', type_='foreignkey')
+        batch_op.drop_constraint('tool_calls_input_blob_hash_fkey', type_='foreignkey')
+        batch_op.drop_column('output_size')
+        batch_op.drop_column('input_size')
+        batch_op.drop_column('output_blob_hash')
+        batch_op.drop_column('input_blob_hash')
+    op.drop_table('tool_payload_blobs')
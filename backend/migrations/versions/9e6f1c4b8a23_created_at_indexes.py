@@ -0,0 +1,29 @@
+"""created_at indexes for time-windowed export
+
+Revision ID: 9e6f1c4b8a23
+Revises: 5b8d3e2a9c17
+Create Date: 2026-10-19 20:12:44.902115
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e6f1c4b8a23'
+down_revision: Union[str, None] = '5b8d3e2a9c17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('conversations', 'messages', 'run_summaries', 'trace_steps', 'tool_calls', 'llm_calls')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.create_index(f'ix_{table}_created_at', table, ['created_at'])
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.drop_index(f'ix_{table}_created_at', table_name=table)
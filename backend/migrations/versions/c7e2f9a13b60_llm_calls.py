@@ -0,0 +1,55 @@
+"""llm_calls usage telemetry
+
+Revision ID: c7e2f9a13b60
+Revises: 8d41b6e0c2f5
+Create Date: 2026-10-19 13:27:40.551093
+
+"""
+from datetime import date, timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e2f9a13b60'
+down_revision: Union[str, None] = '8d41b6e0c2f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PREMAKE_DAYS = 7
+
+
+def upgrade() -> None:
+    is_pg = op.get_bind().dialect.name == 'postgresql'
+    op.create_table('llm_calls',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('conversation_id', sa.String(), nullable=False),
+    sa.Column('node', sa.String(), nullable=False),
+    sa.Column('provider', sa.String(), nullable=False),
+    sa.Column('model', sa.String(), nullable=False),
+    sa.Column('prompt_tokens', sa.Integer(), nullable=False),
+    sa.Column('completion_tokens', sa.Integer(), nullable=False),
+    sa.Column('latency_ms', sa.Float(), nullable=False),
+    sa.Column('batch_size', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['conversation_id'], ['conversations.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', 'created_at'),
+    **({'postgresql_partition_by': 'RANGE (created_at)'} if is_pg else {})
+    )
+    op.create_index('ix_llm_calls_conversation_created', 'llm_calls', ['conversation_id', 'created_at'])
+
+    if is_pg:
+        op.execute("CREATE TABLE llm_calls_default PARTITION OF llm_calls DEFAULT")
+        for offset in range(PREMAKE_DAYS):
+            day = date.today() + timedelta(days=offset)
+            op.execute(
+                f"CREATE TABLE llm_calls_p{day:%Y%m%d} PARTITION OF llm_calls "
+                f"FOR VALUES FROM ('{day.isoformat()}') TO ('{(day + timedelta(days=1)).isoformat()}')"
+            )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_llm_calls_conversation_created', table_name='llm_calls')
+    op.drop_table('llm_calls')
@@ -0,0 +1,49 @@
+"""telemetry aggregates and tool call status/latency
+
+Revision ID: e4a1b7c9d2f3
+Revises: c7e2f9a13b60
+Create Date: 2026-10-19 16:02:11.208437
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a1b7c9d2f3'
+down_revision: Union[str, None] = 'c7e2f9a13b60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('telemetry_aggregates',
+    sa.Column('kind', sa.String(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('bucket_start', sa.DateTime(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('error_count', sa.Integer(), nullable=False),
+    sa.Column('latency_count', sa.Integer(), nullable=False),
+    sa.Column('latency_sum_ms', sa.Float(), nullable=False),
+    sa.Column('latency_sketch', sa.JSON(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('kind', 'name', 'bucket_start')
+    )
+    op.create_table('analytics_watermarks',
+    sa.Column('source', sa.String(), nullable=False),
+    sa.Column('processed_until', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('source')
+    )
+    with op.batch_alter_table('tool_calls') as batch_op:
+        batch_op.add_column(sa.Column('status', sa.String(), server_default='ok', nullable=False))
+        batch_op.add_column(sa.Column('latency_ms', sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('tool_calls') as batch_op:
+        batch_op.drop_column('latency_ms')
+        batch_op.drop_column('status')
+    op.drop_table('analytics_watermarks')
+    op.drop_table('telemetry_aggregates')
@@ -0,0 +1,59 @@
+from app.agents.guardrails import GroundingIndex, apply_retractions, check_answer, check_sentence
+from app.llm.fake import DEFAULT_RESPONDERS
+from app.llm.types import LLMRequest
+
+CHUNKS = [
+    "Employees accrue 20 days PTO per year, with sick time up to 40 hours/year where applicable.",
+    "Baby bonding leave and maternity leave are available; specific durations vary by policy.",
+    "Requests should be submitted in advance; approvals depend on manager coverage needs.",
+]
+
+
+def test_grounded_sentence_passes():
+    assert check_answer("Employees accrue 20 days PTO per year.", CHUNKS) == []
+
+
+def test_changed_number_is_retracted_with_source_as_correction():
+    retractions = check_answer("Employees accrue 90 days PTO per year.", CHUNKS)
+    assert len(retractions) == 1
+    assert retractions[0].correction == CHUNKS[0]
+
+
+def test_changed_number_in_list_item_keeps_marker():
+    retraction = check_sentence(GroundingIndex(CHUNKS), 0, "- Sick time up to 80 hours/year where applicable.")
+    assert retraction is not None
+    assert retraction.correction == "- " + CHUNKS[0]
+
+
+def test_claim_behind_meta_opener_is_checked():
+    answer = "If you work in California you get 60 days of PTO per year."
+    retractions = check_answer(answer, CHUNKS)
+    assert len(retractions) == 1
+    assert retractions[0].sentence == answer
+
+
+def test_meta_phrase_inside_claim_does_not_exempt_it():
+    retractions = check_answer("Managers approve requests if you ask 3 months in advance.", CHUNKS)
+    assert len(retractions) == 1
+
+
+def test_conversational_sentences_are_not_checked():
+    answer = (
+        "Here’s a summary of the leave policy.\n"
+        "If you tell me your location and employee type, I can tailor the rules to your case.\n"
+        "Let me know if anything is unclear."
+    )
+    assert check_answer(answer, CHUNKS) == []
+
+
+def test_unsupported_sentence_without_match_is_dropped():
+    answer = "Employees accrue 20 days PTO per year.\nUnlimited remote work is guaranteed for everyone."
+    retractions = check_answer(answer, CHUNKS)
+    assert [r.correction for r in retractions] == [None]
+    assert apply_retractions(answer, retractions) == "Employees accrue 20 days PTO per year.\n"
+
+
+def test_fake_supervisor_answer_has_no_retractions():
+    request = LLMRequest(template="supervisor", messages=[], variables={"chunk_list": CHUNKS})
+    answer = DEFAULT_RESPONDERS["supervisor"](request)
+    assert check_answer(answer, CHUNKS) == []
@@ -0,0 +1,283 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from app.llm import retry
+from app.llm.client import LLMClient, usage_record
+from app.llm.fake import FakeProvider
+from app.llm.providers import OpenAIProvider, parse_retry_after
+from app.llm.retry import call_with_retries
+from app.llm.types import LLMError, RetryableLLMError
+
+
+def _echo_planner(request):
+    return request.variables["user_message"]
+
+
+def _openai_provider(handler) -> OpenAIProvider:
+    provider = OpenAIProvider(api_key="test", model="gpt-test", base_url="https://llm.test/v1")
+    provider._client = httpx.Client(base_url="https://llm.test/v1", transport=httpx.MockTransport(handler))
+    return provider
+
+
+def _chat_ok(text: str) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "model": "gpt-test",
+            "choices": [{"message": {"content": text}}],
+            "usage": {"prompt_tokens": 11, "completion_tokens": 3},
+        },
+    )
+
+
+# --- retries ---------------------------------------------------------------
+
+
+def test_retry_after_is_a_floor_for_the_backoff_delay():
+    delays = []
+    attempts = iter([RetryableLLMError("429", retry_after=2.0), RetryableLLMError("429", retry_after=3.0)])
+
+    def flaky():
+        error = next(attempts, None)
+        if error:
+            raise error
+        return "ok"
+
+    assert call_with_retries(flaky, max_retries=3, base_s=0.25, sleep=delays.append) == "ok"
+    assert len(delays) == 2
+    assert delays[0] >= 2.0 and delays[1] >= 3.0
+
+
+def test_backoff_uses_full_jitter_capped_exponentially(monkeypatch):
+    bounds = []
+    monkeypatch.setattr(retry.random, "uniform", lambda lo, hi: bounds.append((lo, hi)) or hi)
+    delays = []
+
+    def always_fails():
+        raise RetryableLLMError("503")
+
+    with pytest.raises(RetryableLLMError):
+        call_with_retries(always_fails, max_retries=4, base_s=0.5, max_s=2.0, sleep=delays.append)
+
+    assert bounds == [(0, 0.5), (0, 1.0), (0, 2.0), (0, 2.0)]
+    assert delays == [0.5, 1.0, 2.0, 2.0]
+
+
+def test_non_retryable_errors_are_raised_immediately():
+    calls = []
+
+    def bad_request():
+        calls.append(1)
+        raise LLMError("400")
+
+    with pytest.raises(LLMError):
+        call_with_retries(bad_request, max_retries=3, sleep=lambda s: pytest.fail("should not sleep"))
+    assert len(calls) == 1
+
+
+def test_client_retries_rate_limited_http_calls_honoring_retry_after(monkeypatch):
+    slept = []
+    monkeypatch.setattr(retry.random, "uniform", lambda lo, hi: 0.0)
+    monkeypatch.setattr(retry.time, "sleep", slept.append)
+    responses = iter([
+        httpx.Response(429, headers={"Retry-After": "2"}),
+        httpx.Response(503),
+    ])
+
+    def handler(request):
+        return next(responses, None) or _chat_ok("planned")
+
+    client = LLMClient(_openai_provider(handler), max_retries=3)
+    response = client.complete("planner", user_message="hi")
+
+    assert response.text == "planned"
+    assert slept == [2.0, 0.0]
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [("2", 2.0), ("0.5", 0.5), (" 1.25 ", 1.25), ("-3", 0.0), (None, None), ("soon", None), ("nan", None)],
+)
+def test_parse_retry_after_seconds(header, expected):
+    assert parse_retry_after(header) == expected
+
+
+def test_parse_retry_after_http_date():
+    when = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 <= parse_retry_after(format_datetime(when, usegmt=True)) <= 30
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_client_honors_fractional_retry_after(monkeypatch):
+    slept = []
+    monkeypatch.setattr(retry.random, "uniform", lambda lo, hi: 0.0)
+    monkeypatch.setattr(retry.time, "sleep", slept.append)
+    responses = iter([httpx.Response(429, headers={"Retry-After": "0.5"})])
+
+    def handler(request):
+        return next(responses, None) or _chat_ok("ok")
+
+    assert LLMClient(_openai_provider(handler)).complete("planner", user_message="hi").text == "ok"
+    assert slept == [0.5]
+
+
+def test_client_gives_up_after_max_retries(monkeypatch):
+    monkeypatch.setattr(retry.time, "sleep", lambda s: None)
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(502)
+
+    client = LLMClient(_openai_provider(handler), max_retries=2)
+    with pytest.raises(RetryableLLMError):
+        client.complete("planner", user_message="hi")
+    assert len(seen) == 3
+
+
+# --- micro-batching ----------------------------------------------------------
+
+
+def _concurrent_completions(client: LLMClient, n: int) -> list:
+    results = [None] * n
+    barrier = threading.Barrier(n)
+
+    def run(i):
+        barrier.wait()
+        results[i] = client.complete("planner", batchable=True, user_message=f"question {i}")
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5)
+    return results
+
+
+def test_concurrent_batchable_calls_share_round_trips_and_fan_out_in_order():
+    provider = FakeProvider(responders={"planner": _echo_planner}, latency_s=0.05)
+    client = LLMClient(provider, batch_max_size=8, batch_max_wait_ms=50)
+
+    results = _concurrent_completions(client, 8)
+
+    assert [r.text for r in results] == [f"question {i}" for i in range(8)]
+    assert provider.calls < 8
+    assert sum(1 for r in results if r.batch_size > 1) >= 2
+
+
+def test_batch_failure_is_raised_in_every_caller():
+    class Down(FakeProvider):
+        def complete_batch(self, requests):
+            self.calls += 1
+            raise LLMError("provider down")
+
+    provider = Down()
+    client = LLMClient(provider, max_retries=0, batch_max_size=4, batch_max_wait_ms=50)
+    errors = []
+    barrier = threading.Barrier(4)
+
+    def run():
+        barrier.wait()
+        try:
+            client.complete("planner", batchable=True, user_message="q")
+        except LLMError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5)
+
+    assert len(errors) == 4
+    assert provider.calls < 4
+
+
+def test_short_batch_response_fails_every_caller_instead_of_hanging():
+    class Lossy(FakeProvider):
+        def complete_batch(self, requests):
+            return super().complete_batch(requests)[:-1]
+
+    client = LLMClient(Lossy(), max_retries=0, batch_max_size=4, batch_max_wait_ms=50)
+    outcomes = []
+    barrier = threading.Barrier(3)
+
+    def run():
+        barrier.wait()
+        try:
+            client.complete("planner", batchable=True, user_message="q")
+            outcomes.append("ok")
+        except LLMError:
+            outcomes.append("error")
+
+    threads = [threading.Thread(target=run, daemon=True) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5)
+
+    assert not any(t.is_alive() for t in threads)
+    assert outcomes == ["error"] * 3
+
+
+def test_lone_batchable_call_does_not_wait_for_the_batch_window():
+    client = LLMClient(FakeProvider(), batch_max_size=8, batch_max_wait_ms=500)
+
+    start = time.perf_counter()
+    response = client.complete("planner", batchable=True, user_message="q")
+
+    assert time.perf_counter() - start < 0.25
+    assert response.batch_size == 1
+
+
+def test_max_batch_size_is_respected():
+    provider = FakeProvider(responders={"planner": _echo_planner}, latency_s=0.05)
+    client = LLMClient(provider, batch_max_size=3, batch_max_wait_ms=50)
+
+    results = _concurrent_completions(client, 7)
+
+    assert all(r.batch_size <= 3 for r in results)
+    assert provider.calls >= 3
+
+
+# --- usage records -------------------------------------------------------------
+
+
+def test_usage_record_from_fake_provider():
+    provider = FakeProvider(responders={"planner": lambda r: "one two three"})
+    client = LLMClient(provider, batch_max_size=1)
+
+    response = client.complete("planner", user_message="how many pto days")
+    record = usage_record("planner", response)
+
+    prompt_words = sum(len(m["content"].split()) for m in provider.requests[0].messages)
+    assert record == {
+        "node": "planner",
+        "provider": "fake",
+        "model": "fake-1",
+        "prompt_tokens": prompt_words,
+        "completion_tokens": 3,
+        "latency_ms": response.latency_ms,
+        "batch_size": 1,
+    }
+    assert record["latency_ms"] > 0
+
+
+def test_usage_record_uses_provider_reported_usage_and_caller_latency():
+    def handler(request):
+        time.sleep(0.02)
+        return _chat_ok("answer")
+
+    client = LLMClient(_openai_provider(handler))
+    record = usage_record("supervisor", client.complete("supervisor", user_message="q", plan="p", chunks=""))
+
+    assert record["provider"] == "openai"
+    assert record["model"] == "gpt-test"
+    assert (record["prompt_tokens"], record["completion_tokens"]) == (11, 3)
+    assert record["latency_ms"] >= 20
+    assert record["batch_size"] == 1
@@ -0,0 +1,68 @@
+import pytest
+
+from app.agents import langgraph_agent
+from app.agents.langgraph_agent import POLICY_SEARCH_TOOL, _init_state, _planner_node, _tool_node
+from app.agents.plan_cache import plan_cache
+from app.llm.client import LLMClient
+from app.llm.fake import FakeProvider
+from app.tools.registry import ToolSpec, get_tool, register_tool
+
+
+def _echo_prompt(request):
+    return request.messages[-1]["content"]
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    provider = FakeProvider(responders={"planner": _echo_prompt, "planner_template": _echo_prompt})
+    client = LLMClient(provider, batch_max_size=1)
+    monkeypatch.setattr(langgraph_agent, "get_llm_client", lambda: client)
+    plan_cache.invalidate()
+    yield provider
+    plan_cache.invalidate()
+
+
+@pytest.fixture
+def restore_tool():
+    original = get_tool(POLICY_SEARCH_TOOL)
+    yield original
+    register_tool(original)
+
+
+def test_cached_plan_is_written_without_user_text(provider):
+    first = _planner_node(_init_state("c1", "How much PTO do I accrue? My manager is Alice."))
+    second = _planner_node(_init_state("c2", "How does PTO accrual work for part-timers?"))
+
+    assert (first["plan_source"], second["plan_source"]) == ("llm", "template")
+    assert [r.template for r in provider.requests] == ["planner_template"]
+    assert "user_message" not in provider.requests[0].variables
+    assert "Alice" not in second["plan"]
+    assert POLICY_SEARCH_TOOL in second["plan"]
+
+
+def test_unclassified_request_is_planned_per_request_and_not_cached(provider):
+    state = _planner_node(_init_state("c1", "Who won the game last night?"))
+
+    assert state["plan_source"] == "llm"
+    assert [r.template for r in provider.requests] == ["planner"]
+    assert "Who won the game last night?" in state["plan"]
+    assert plan_cache.snapshot()["entries"] == []
+
+
+def test_tool_node_runs_the_registered_tool(provider, restore_tool):
+    _planner_node(_init_state("c1", "How much PTO do I accrue?"))
+    register_tool(
+        ToolSpec(
+            name=POLICY_SEARCH_TOOL,
+            description=restore_tool.description,
+            run=lambda tool_input: {"top_chunks": [f"v2 result for {tool_input['query']}"]},
+            version="2",
+        )
+    )
+
+    state = _tool_node(_init_state("c1", "pto"))
+    assert state["tool_output"] == {"top_chunks": ["v2 result for pto"]}
+
+    # The new tool version invalidates plans written for the old tool set
+    assert _planner_node(_init_state("c2", "How much PTO do I accrue?"))["plan_source"] == "llm"
+    assert len(provider.requests) == 2